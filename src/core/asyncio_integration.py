@@ -7,6 +7,7 @@ by properly integrating Python's asyncio event loop with GTK's GLib main loop.
 import asyncio
 import threading
 from collections.abc import Coroutine
+from concurrent.futures import Future
 from typing import Any
 
 try:
@@ -56,7 +57,7 @@ def get_event_loop() -> asyncio.AbstractEventLoop:
     return _loop
 
 
-def schedule_async(coro: Coroutine[Any, Any, Any]) -> asyncio.Task[Any]:
+def schedule_async(coro: Coroutine[Any, Any, Any]) -> Future[Any]:
     """Schedule a coroutine to run on the asyncio event loop from GTK callbacks.
 
     This properly integrates Python's asyncio with GTK4's GLib main loop.
@@ -69,13 +70,14 @@ def schedule_async(coro: Coroutine[Any, Any, Any]) -> asyncio.Task[Any]:
         coro: The coroutine to schedule.
 
     Returns:
-        An asyncio.Task that can be awaited if needed.
+        A concurrent.futures.Future for the coroutine's result. It is safe to
+        cancel from the GTK thread; it cannot be awaited there.
     """
     loop = get_event_loop()
     return asyncio.run_coroutine_threadsafe(coro, loop)
 
 
-def create_task(coro: Coroutine[Any, Any, Any]) -> asyncio.Task[Any]:
+def create_task(coro: Coroutine[Any, Any, Any]) -> Future[Any]:
     """Create an asyncio task, properly integrated with GTK.
 
     This is a drop-in replacement for asyncio.create_task() that works
@@ -85,7 +87,7 @@ def create_task(coro: Coroutine[Any, Any, Any]) -> asyncio.Task[Any]:
         coro: The coroutine to create a task for.
 
     Returns:
-        An asyncio.Task.
+        A concurrent.futures.Future for the coroutine's result.
     """
     loop = get_event_loop()
     return asyncio.run_coroutine_threadsafe(coro, loop)
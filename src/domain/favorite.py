@@ -2,8 +2,11 @@
 
 from dataclasses import dataclass
 from datetime import datetime
+from functools import cached_property
 from typing import TYPE_CHECKING
 
+from .wallpaper import format_metadata
+
 if TYPE_CHECKING:
     pass
 
@@ -30,6 +33,17 @@ class Favorite:
         """Get wallpaper ID for serialization."""
         return self.wallpaper.id
 
+    @cached_property
+    def search_text(self) -> str:
+        """Text matched against favorites search queries."""
+        wallpaper = self.wallpaper
+        return f"{wallpaper.id} {wallpaper.category} {wallpaper.url}"
+
+    @cached_property
+    def metadata_text(self) -> str:
+        """Resolution and file size line shown under the favorite, formatted once."""
+        return format_metadata(self.wallpaper.resolution, self.wallpaper.file_size)
+
     def to_dict(self) -> dict:
         """Convert to dict for JSON serialization."""
         return {
@@ -2,6 +2,27 @@
 
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+
+
+def format_file_size(size: int) -> str:
+    """Human-readable file size, e.g. "2.0 MB", "512.0 KB" or "12 B"."""
+    if size >= 1024 * 1024:
+        return f"{size / (1024 * 1024):.1f} MB"
+    if size >= 1024:
+        return f"{size / 1024:.1f} KB"
+    return f"{size} B"
+
+
+@lru_cache(maxsize=1024)
+def format_metadata(resolution: "Resolution | str | None", size: int) -> str:
+    """Card metadata line "WxH • size", leaving out whichever part is unknown."""
+    parts = []
+    if resolution:
+        parts.append(str(resolution))
+    if size:
+        parts.append(format_file_size(size))
+    return " • ".join(parts)
 
 
 class WallpaperSource(Enum):
@@ -41,7 +62,7 @@ class Resolution:
         return {"width": self.width, "height": self.height}
 
 
-@dataclass
+@dataclass(slots=True)
 class Wallpaper:
     """Domain entity representing a wallpaper."""
 
@@ -57,6 +78,15 @@ class Wallpaper:
     thumbs_large: str = ""
     thumbs_small: str = ""
     tags: list[str] = field(default_factory=list)
+    filename: str = field(init=False, repr=False, compare=False)
+    extension: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Parse the file name and extension from path once, at construction."""
+        self.filename = self.path.rsplit("/", 1)[-1]
+        self.extension = (
+            self.filename.rsplit(".", 1)[-1] if "." in self.filename else "jpg"
+        )
 
     # Domain behavior
     @property
@@ -4,8 +4,6 @@ import json
 from datetime import datetime
 from pathlib import Path
 
-from rapidfuzz import process
-
 from domain.exceptions import ServiceError
 from domain.favorite import Favorite
 from domain.wallpaper import Wallpaper
@@ -27,6 +25,9 @@ class FavoritesService(BaseService):
         )
         self.favorites_dir = self.favorites_file.parent
         self._favorites: list[Favorite] = []
+        self._favorite_ids: frozenset[str] = frozenset()
+        # (mtime_ns, size) of the file _favorites was parsed from or saved to
+        self._loaded_stat: tuple[int, int] | None = None
 
     def _ensure_favorites_file_exists(self) -> None:
         """Create favorites directory and file if they don't exist."""
@@ -47,12 +48,18 @@ class FavoritesService(BaseService):
             self._ensure_favorites_file_exists()
 
             if self.favorites_file.exists():
-                with open(self.favorites_file) as f:
-                    favorites_data = json.load(f)
-                self._favorites = self._parse_favorites_data(favorites_data)
-                self.log_debug(f"Loaded {len(self._favorites)} favorites")
+                # Searches reload on every keystroke; only reparse when the file changed
+                file_stat = self._file_stat()
+                if file_stat != self._loaded_stat:
+                    with open(self.favorites_file) as f:
+                        favorites_data = json.load(f)
+                    favorites = self._parse_favorites_data(favorites_data)
+                    self._set_cached_favorites(favorites)
+                    self._loaded_stat = self._file_stat()
+                    self.log_debug(f"Loaded {len(self._favorites)} favorites")
             else:
-                self._favorites = []
+                self._set_cached_favorites([])
+                self._loaded_stat = None
         except (json.JSONDecodeError, OSError) as e:
             self.log_error(
                 f"Failed to load favorites from {self.favorites_file}: {e}",
@@ -60,7 +67,16 @@ class FavoritesService(BaseService):
             )
             raise ServiceError(f"Failed to load favorites: {e}") from e
 
-        return self._favorites
+        # Callers append/filter the result before saving; keep the cache intact
+        return list(self._favorites)
+
+    def _set_cached_favorites(self, favorites: list[Favorite]) -> None:
+        self._favorites = favorites
+        self._favorite_ids = frozenset(f.wallpaper_id for f in favorites)
+
+    def _file_stat(self) -> tuple[int, int]:
+        stat = self.favorites_file.stat()
+        return stat.st_mtime_ns, stat.st_size
 
     def _parse_favorites_data(self, data) -> list[Favorite]:
         from domain.wallpaper import (
@@ -133,17 +149,41 @@ class FavoritesService(BaseService):
         Args:
             wallpaper: Wallpaper domain model to add
         """
-        favorites = self._load_favorites()
-
-        if self.is_favorite(wallpaper.id):
+        if wallpaper.id in self.get_favorite_ids():
             self.log_debug(f"Wallpaper {wallpaper.id} already in favorites")
             return
 
+        favorites = self._load_favorites()
         favorite = Favorite(wallpaper=wallpaper, added_at=datetime.now())
         favorites.append(favorite)
         self._save_favorites(favorites)
         self.log_info(f"Added wallpaper {wallpaper.id} to favorites")
 
+    def add_favorites(self, wallpapers: list[Wallpaper]) -> int:
+        """Add several wallpapers to favorites with a single save.
+
+        Args:
+            wallpapers: Wallpaper domain models to add
+
+        Returns:
+            Number of wallpapers that were not already favorites
+        """
+        favorites = self._load_favorites()
+        known_ids = set(self.get_favorite_ids())
+
+        added = 0
+        for wallpaper in wallpapers:
+            if wallpaper.id in known_ids:
+                continue
+            known_ids.add(wallpaper.id)
+            favorites.append(Favorite(wallpaper=wallpaper, added_at=datetime.now()))
+            added += 1
+
+        if added:
+            self._save_favorites(favorites)
+            self.log_info(f"Added {added} wallpapers to favorites")
+        return added
+
     def remove_favorite(self, wallpaper_id: str) -> bool:
         """Remove wallpaper from favorites by ID.
 
@@ -175,8 +215,19 @@ class FavoritesService(BaseService):
         Returns:
             True if wallpaper is in favorites, False otherwise
         """
-        favorites = self._load_favorites()
-        return any(f.wallpaper_id == wallpaper_id for f in favorites)
+        return wallpaper_id in self.get_favorite_ids()
+
+    def get_favorite_ids(self) -> frozenset[str]:
+        """Get IDs of all favorite wallpapers.
+
+        The set is cached alongside the parsed favorites, so membership checks
+        cost a file stat rather than a scan of every favorite.
+
+        Returns:
+            Set of favorite wallpaper IDs
+        """
+        self._load_favorites()
+        return self._favorite_ids
 
     def get_favorites(self) -> list[Favorite]:
         """Get all favorite wallpapers.
@@ -201,15 +252,17 @@ class FavoritesService(BaseService):
         if not query:
             return favorites
 
-        # Build searchable strings from wallpaper data
-        search_strings = [
-            f"{w.wallpaper.id} {w.wallpaper.category} {w.wallpaper.url}"
-            for w in favorites
-        ]
+        # Search strings are built once per parsed favorite, not per keystroke
+        search_strings = [f.search_text for f in favorites]
 
-        # Use rapidfuzz for fuzzy matching
-        results = process.extract(query, search_strings, limit=len(favorites))
-        matched_indices = [result[2] for result in results if result[1] >= 60]
+        # Use rapidfuzz for fuzzy matching, imported on first search
+        from rapidfuzz import process
+
+        # The cutoff lets rapidfuzz drop poor candidates early
+        results = process.extract(
+            query, search_strings, limit=len(favorites), score_cutoff=60
+        )
+        matched_indices = [result[2] for result in results]
 
         return [favorites[i].wallpaper for i in matched_indices]
 
@@ -226,7 +279,8 @@ class FavoritesService(BaseService):
             favorites_data = [f.to_dict() for f in favorites]
             with open(self.favorites_file, "w") as f:
                 json.dump(favorites_data, f, indent=4)
-            self._favorites = favorites
+            self._set_cached_favorites(favorites)
+            self._loaded_stat = self._file_stat()
             self.log_debug(f"Saved {len(favorites)} favorites to {self.favorites_file}")
         except OSError as e:
             self.log_error(
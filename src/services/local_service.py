@@ -5,12 +5,14 @@ Handles browsing, searching, and deleting local wallpapers
 
 import asyncio
 import logging
+import os
 from pathlib import Path
 
 from gi.repository import GObject
-from rapidfuzz import fuzz, process
 from send2trash import send2trash
 
+from domain.wallpaper import format_metadata
+
 
 class LocalWallpaper(GObject.Object):
     __gtype_name__ = "LocalWallpaper"
@@ -26,11 +28,16 @@ class LocalWallpaper(GObject.Object):
     ):
         super().__init__()
         self.path = path
+        # Views key cards and lookups by the string form; build it once
+        self.path_str = str(path)
         self.filename = filename
         self.size = size
         self.modified_time = modified_time
         self._resolution = resolution
         self._tags = tags if tags is not None else []
+        self._metadata_text: str | None = None
+        self._tags_display: str | None = None
+        self._tags_tooltip: str | None = None
 
     @property
     def resolution(self):
@@ -41,6 +48,14 @@ class LocalWallpaper(GObject.Object):
     @resolution.setter
     def resolution(self, value):
         self._resolution = value
+        self._metadata_text = None
+
+    @property
+    def metadata_text(self) -> str:
+        """Resolution and size line shown on the card, formatted on first use."""
+        if self._metadata_text is None:
+            self._metadata_text = format_metadata(self.resolution, self.size)
+        return self._metadata_text
 
     @property
     def tags(self) -> list[str]:
@@ -52,6 +67,26 @@ class LocalWallpaper(GObject.Object):
     @tags.setter
     def tags(self, value: list[str]):
         self._tags = value
+        self._tags_display = None
+        self._tags_tooltip = None
+
+    @property
+    def tags_display(self) -> str:
+        """First five tags as '#tag' text shown on the card, '' when untagged."""
+        if self._tags_display is None:
+            tags = self.tags
+            text = " ".join(f"#{tag}" for tag in tags[:5])
+            if len(tags) > 5:
+                text += f" +{len(tags) - 5}"
+            self._tags_display = text
+        return self._tags_display
+
+    @property
+    def tags_tooltip(self) -> str:
+        """All tags joined for the card tooltip, '' when untagged."""
+        if self._tags_tooltip is None:
+            self._tags_tooltip = " • ".join(self.tags)
+        return self._tags_tooltip
 
     def _load_resolution(self):
         try:
@@ -106,25 +141,46 @@ class LocalWallpaperService:
         wallpapers = []
 
         try:
-            if recursive:
-                pattern = "**/*"
-            else:
-                pattern = "*"
-
-            for file_path in self.pictures_dir.glob(pattern):
-                if file_path.is_file() and file_path.suffix.lower() in self.SUPPORTED_EXTENSIONS:
-                    stat = file_path.stat()
-
-                    # Defer resolution reading - too expensive at scan time
-                    wallpapers.append(
-                        LocalWallpaper(
-                            path=file_path,
-                            filename=file_path.name,
-                            size=stat.st_size,
-                            modified_time=stat.st_mtime,
-                            resolution=None,
+            # os.scandir hands back cached file type info, so each image costs
+            # a single stat() and modified_time is materialized once here
+            pending = [self.pictures_dir]
+            while pending:
+                directory = pending.pop()
+                try:
+                    entries = os.scandir(directory)
+                except OSError as e:
+                    # Unreadable or removed mid-scan; list everything else
+                    logging.warning(f"Skipping {directory}: {e}")
+                    continue
+                with entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive:
+                                pending.append(Path(entry.path))
+                            continue
+
+                        file_path = Path(entry.path)
+                        if (
+                            file_path.suffix.lower() not in self.SUPPORTED_EXTENSIONS
+                            or not entry.is_file()
+                        ):
+                            continue
+
+                        try:
+                            stat = entry.stat()
+                        except OSError:
+                            continue
+
+                        # Defer resolution reading - too expensive at scan time
+                        wallpapers.append(
+                            LocalWallpaper(
+                                path=file_path,
+                                filename=entry.name,
+                                size=stat.st_size,
+                                modified_time=stat.st_mtime,
+                                resolution=None,
+                            )
                         )
-                    )
 
             # Sort by modification time (newest first)
             wallpapers.sort(key=lambda w: w.modified_time, reverse=True)
@@ -160,6 +216,9 @@ class LocalWallpaperService:
         if not wallpapers_list:
             return []
 
+        # Only needed once the user actually searches
+        from rapidfuzz import fuzz, process
+
         query_lower = query.lower()
 
         # Score by combining filename fuzzy match and tag match
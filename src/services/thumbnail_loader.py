@@ -4,9 +4,10 @@ This service handles the GTK-specific thumbnail loading logic that was
 previously in BaseViewModel, properly separating concerns.
 """
 
+import hashlib
 import logging
 from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 import gi
@@ -21,6 +22,8 @@ logger = logging.getLogger(__name__)
 # Thumbnail cache directory
 _THUMBNAIL_CACHE_DIR = Path.home() / ".cache" / "wallpicker" / "thumbnails"
 _THUMBNAIL_SIZE = (200, 160)
+# Bytes read from the start of an image to derive its content key
+_CONTENT_KEY_BYTES = 1 << 20
 
 
 class ThumbnailLoader:
@@ -36,6 +39,8 @@ class ThumbnailLoader:
         self._thumbnail_cache = thumbnail_cache
         self._executor = ThreadPoolExecutor(max_workers=max_workers)
         self._local_thumbnail_cache = {}  # In-memory cache for local thumbnails
+        # path -> (mtime_ns, size, content key), so unchanged files aren't rehashed
+        self._content_keys: dict[str, tuple[int, int, str]] = {}
         self._ensure_cache_dir()
 
     def _ensure_cache_dir(self):
@@ -45,15 +50,28 @@ class ThumbnailLoader:
         except Exception as e:
             logger.warning(f"Could not create thumbnail cache directory: {e}")
 
+    def _get_content_key(self, path: Path) -> str:
+        """Get a content-derived cache key for a local image.
+
+        Renamed, moved or duplicated files share a key, so they share a thumbnail.
+        """
+        stat = path.stat()
+        cached = self._content_keys.get(str(path))
+        if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(stat.st_size.to_bytes(8, "little"))
+        with open(path, "rb") as f:
+            digest.update(f.read(_CONTENT_KEY_BYTES))
+        key = digest.hexdigest()
+
+        self._content_keys[str(path)] = (stat.st_mtime_ns, stat.st_size, key)
+        return key
+
     def _get_local_thumbnail_path(self, file_path: str) -> Path:
         """Get the path for a local thumbnail file."""
-        # Use file path hash for cache key
-        path = Path(file_path)
-        cache_key = f"{path.stat().st_mtime}_{path.stat().st_size}"
-        return (
-            _THUMBNAIL_CACHE_DIR
-            / f"local_{hash(file_path) & 0xFFFFFFFF:08x}_{cache_key}.jpg"
-        )
+        return _THUMBNAIL_CACHE_DIR / f"local_{self._get_content_key(Path(file_path))}.jpg"
 
     def _generate_thumbnail(self, file_path: str) -> bytes | None:
         """Generate a thumbnail for a local image file.
@@ -68,12 +86,10 @@ class ThumbnailLoader:
             if not path.exists():
                 return None
 
-            # Check if thumbnail already exists and is up to date
+            # Thumbnails are keyed by content, so an existing one is always current
             thumb_path = self._get_local_thumbnail_path(file_path)
             if thumb_path.exists():
-                # Check if source is older than thumbnail
-                if path.stat().st_mtime <= thumb_path.stat().st_mtime:
-                    return thumb_path.read_bytes()
+                return thumb_path.read_bytes()
 
             # Generate thumbnail
             with Image.open(path) as img:
@@ -102,97 +118,91 @@ class ThumbnailLoader:
 
         return None
 
+    def _read_thumbnail(self, path_or_url: str) -> bytes | None:
+        """Read thumbnail bytes for a local path or remote URL (worker thread)."""
+        # Handle remote URLs with caching
+        if path_or_url.startswith(("http://", "https://")):
+            if not self._thumbnail_cache:
+                return None
+            logger.debug(f"Loading remote thumbnail: {path_or_url[:60]}...")
+            thumbnail_path = self._thumbnail_cache.get_or_download_sync(path_or_url)
+            if thumbnail_path and thumbnail_path.exists():
+                return thumbnail_path.read_bytes()
+            return None
+
+        # Handle local files - use thumbnail generation
+        if not Path(path_or_url).exists():
+            return None
+
+        # Check in-memory cache first
+        data = self._local_thumbnail_cache.get(path_or_url)
+        if data:
+            return data
+
+        data = self._generate_thumbnail(path_or_url)
+        if data:
+            self._local_thumbnail_cache[path_or_url] = data
+        return data
+
+    def _load_and_deliver(
+        self, path_or_url: str, callbacks: list[Callable[[Gdk.Texture | None], None]]
+    ) -> None:
+        texture = None
+        try:
+            data = self._read_thumbnail(path_or_url)
+            if data:
+                # Decoding happens here; Gdk.Texture is immutable and thread-safe
+                texture = Gdk.Texture.new_from_bytes(GLib.Bytes.new(data))
+        except Exception as e:
+            logger.error(
+                f"Failed to load thumbnail from {path_or_url}: {e}", exc_info=True
+            )
+
+        # Only the callbacks run on the main thread
+        def deliver():
+            for callback in callbacks:
+                callback(texture)
+            return False
+
+        GLib.idle_add(deliver)
+
     def load_thumbnail_async(
         self, path_or_url: str, callback: Callable[[Gdk.Texture | None], None]
-    ) -> None:
+    ) -> Future:
         """Load thumbnail asynchronously and invoke callback on main thread.
 
         Args:
             path_or_url: Local file path or remote URL
             callback: Function to call with Gdk.Texture or None on failure
+
+        Returns:
+            Future of the load; cancelling it before it starts skips the load
+            and the callback
         """
+        return self.load_thumbnails_batch([(path_or_url, callback)])[path_or_url]
 
-        def _load_thumbnail():
-            try:
-                # Handle remote URLs with caching
-                if path_or_url.startswith(("http://", "https://")):
-                    if self._thumbnail_cache:
-                        logger.debug(f"Loading remote thumbnail: {path_or_url[:60]}...")
-                        thumbnail_path = self._thumbnail_cache.get_or_download_sync(
-                            path_or_url
-                        )
-                        if thumbnail_path and thumbnail_path.exists():
-                            # Read file bytes in worker thread
-                            try:
-                                data = thumbnail_path.read_bytes()
-
-                                # Schedule texture creation in main thread
-                                def create_remote_texture():
-                                    try:
-                                        texture = Gdk.Texture.new_from_bytes(
-                                            GLib.Bytes.new(data)
-                                        )
-                                        callback(texture)
-                                    except Exception:
-                                        callback(None)
-
-                                GLib.idle_add(create_remote_texture)
-                                return
-                            except Exception:
-                                pass
-
-                    GLib.idle_add(lambda: callback(None))
-                    return
-
-                # Handle local files - use thumbnail generation
-                path = Path(path_or_url)
-                if path.exists():
-                    # Check in-memory cache first
-                    if path_or_url in self._local_thumbnail_cache:
-                        data = self._local_thumbnail_cache[path_or_url]
-                        if data:
-
-                            def create_cached_texture():
-                                try:
-                                    texture = Gdk.Texture.new_from_bytes(
-                                        GLib.Bytes.new(data)
-                                    )
-                                    callback(texture)
-                                except Exception:
-                                    callback(None)
-
-                            GLib.idle_add(create_cached_texture)
-                            return
-
-                    # Generate or load thumbnail in worker thread
-                    thumbnail_data = self._generate_thumbnail(path_or_url)
-
-                    if thumbnail_data:
-                        # Cache in memory
-                        self._local_thumbnail_cache[path_or_url] = thumbnail_data
-
-                        # Create texture in main thread
-                        def create_local_texture():
-                            try:
-                                texture = Gdk.Texture.new_from_bytes(
-                                    GLib.Bytes.new(thumbnail_data)
-                                )
-                                callback(texture)
-                            except Exception:
-                                callback(None)
-
-                        GLib.idle_add(create_local_texture)
-                        return
-
-            except (OSError, Exception) as e:
-                logger.error(
-                    f"Failed to load thumbnail from {path_or_url}: {e}", exc_info=True
-                )
-
-            # Invoke callback with None if loading failed
-            GLib.idle_add(lambda: callback(None))
-
-        self._executor.submit(_load_thumbnail)
+    def load_thumbnails_batch(
+        self, requests: list[tuple[str, Callable[[Gdk.Texture | None], None]]]
+    ) -> dict[str, Future]:
+        """Load many thumbnails, fetching each distinct path or URL only once.
+
+        Args:
+            requests: (path_or_url, callback) pairs; callbacks sharing a path
+                receive the same texture
+
+        Returns:
+            Future of each distinct path or URL, cancellable while still queued
+        """
+        callbacks_by_path: dict[str, list] = {}
+        for path_or_url, callback in requests:
+            callbacks_by_path.setdefault(path_or_url, []).append(callback)
+
+        return {
+            path_or_url: self._executor.submit(
+                self._load_and_deliver, path_or_url, callbacks
+            )
+            for path_or_url, callbacks in callbacks_by_path.items()
+        }
 
     def shutdown(self) -> None:
         """Shutdown the executor."""
@@ -202,6 +212,13 @@ class ThumbnailLoader:
         """Clear the in-memory thumbnail cache."""
         self._local_thumbnail_cache.clear()
 
+    def invalidate_local(self, path: str) -> None:
+        """Forget the in-memory thumbnail of a local file rewritten in place.
+
+        The on-disk thumbnail is keyed by content, so it needs no invalidation.
+        """
+        self._local_thumbnail_cache.pop(path, None)
+
     def __del__(self) -> None:
         """Cleanup on destruction."""
         if hasattr(self, "_executor"):
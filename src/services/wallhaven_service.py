@@ -11,6 +11,9 @@ from domain.exceptions import ServiceError
 from domain.wallpaper import Resolution, Wallpaper, WallpaperPurity, WallpaperSource
 from services.base import BaseService
 
+# API purity names ("sfw", "sketchy", "nsfw") to domain values
+_PURITY_BY_NAME = {purity.value: purity for purity in WallpaperPurity}
+
 
 class WallhavenService(BaseService):
     """Async service for searching and downloading wallpapers from Wallhaven API."""
@@ -18,6 +21,10 @@ class WallhavenService(BaseService):
     BASE_URL = "https://wallhaven.cc/api/v1"
     RATE_LIMIT = 45  # requests per minute
     REQUEST_INTERVAL = 60 / RATE_LIMIT  # seconds between requests
+    DOWNLOAD_CHUNK_SIZE = 64 * 1024  # bytes read per chunk while downloading
+    MAX_CONNECTIONS = 16  # pooled TCP connections shared by the session
+    MAX_CONNECTIONS_PER_HOST = 8
+    DNS_CACHE_TTL = 300  # seconds a resolved host is reused across connections
 
     PRESETS = {
         "Anime": {"purity": "sfw", "categories": "010"},
@@ -37,6 +44,8 @@ class WallhavenService(BaseService):
         super().__init__()
         self.api_key = api_key
         self._last_request_time = 0.0
+        # Serializes _rate_limit so concurrent searches/downloads queue up
+        self._rate_limit_lock = asyncio.Lock()
         self._session: aiohttp.ClientSession | None = None
 
     async def _get_session(self) -> aiohttp.ClientSession:
@@ -46,19 +55,25 @@ class WallhavenService(BaseService):
             if self.api_key:
                 headers["X-API-Key"] = self.api_key
 
-            self._session = aiohttp.ClientSession(headers=headers)
+            connector = aiohttp.TCPConnector(
+                limit=self.MAX_CONNECTIONS,
+                limit_per_host=self.MAX_CONNECTIONS_PER_HOST,
+                ttl_dns_cache=self.DNS_CACHE_TTL,
+            )
+            self._session = aiohttp.ClientSession(headers=headers, connector=connector)
 
         return self._session
 
     async def _rate_limit(self) -> None:
-        """Enforce rate limiting between requests."""
-        now = asyncio.get_event_loop().time()
-        time_since_last = now - self._last_request_time
+        """Enforce rate limiting between requests, one caller at a time."""
+        async with self._rate_limit_lock:
+            now = asyncio.get_event_loop().time()
+            time_since_last = now - self._last_request_time
 
-        if time_since_last < self.REQUEST_INTERVAL:
-            await asyncio.sleep(self.REQUEST_INTERVAL - time_since_last)
+            if time_since_last < self.REQUEST_INTERVAL:
+                await asyncio.sleep(self.REQUEST_INTERVAL - time_since_last)
 
-        self._last_request_time = asyncio.get_event_loop().time()
+            self._last_request_time = asyncio.get_event_loop().time()
 
     async def search(
         self,
@@ -154,12 +169,6 @@ class WallhavenService(BaseService):
             height=data.get("dimension_y", 0),
         )
 
-        purity_map = {
-            "sfw": WallpaperPurity.SFW,
-            "sketchy": WallpaperPurity.SKETCHY,
-            "nsfw": WallpaperPurity.NSFW,
-        }
-
         return Wallpaper(
             id=data["id"],
             url=data["url"],
@@ -167,7 +176,7 @@ class WallhavenService(BaseService):
             resolution=resolution,
             source=WallpaperSource.WALLHAVEN,
             category=data.get("category", "general"),
-            purity=purity_map.get(data.get("purity", "sfw"), WallpaperPurity.SFW),
+            purity=_PURITY_BY_NAME.get(data.get("purity", "sfw"), WallpaperPurity.SFW),
             colors=data.get("colors", []),
             file_size=data.get("file_size", 0),
             thumbs_large=data.get("thumbs", {}).get("large", ""),
@@ -197,20 +206,26 @@ class WallhavenService(BaseService):
         try:
             self.log_info(f"Downloading wallpaper {wallpaper.id}")
 
-            dest.parent.mkdir(parents=True, exist_ok=True)
+            # File I/O runs in a worker thread so slow disks don't stall the loop
+            await asyncio.to_thread(dest.parent.mkdir, parents=True, exist_ok=True)
 
             async with session.get(wallpaper.path) as response:
                 response.raise_for_status()
                 total_size = int(response.headers.get("content-length", 0))
                 downloaded = 0
 
-                with open(dest, "wb") as f:
-                    async for chunk in response.content.iter_chunked(8192):
-                        f.write(chunk)
+                f = await asyncio.to_thread(open, dest, "wb")
+                try:
+                    async for chunk in response.content.iter_chunked(
+                        self.DOWNLOAD_CHUNK_SIZE
+                    ):
+                        await asyncio.to_thread(f.write, chunk)
                         downloaded += len(chunk)
 
                         if progress_callback and total_size > 0:
                             progress_callback(downloaded, total_size)
+                finally:
+                    await asyncio.to_thread(f.close)
 
             self.log_debug(f"Downloaded wallpaper to {dest}")
             return True
@@ -218,6 +233,8 @@ class WallhavenService(BaseService):
             self.log_error(
                 f"Failed to download wallpaper {wallpaper.id}: {e}", exc_info=True
             )
+            # Don't leave a truncated image behind for the local view to pick up
+            await asyncio.to_thread(dest.unlink, missing_ok=True)
             return False
 
     async def close(self) -> None:
@@ -1,7 +1,6 @@
 """Modern Preview Dialog component for wallpaper inspection."""
 
-import sys
-import threading
+import asyncio
 from pathlib import Path
 
 import gi
@@ -13,7 +12,7 @@ gi.require_version("GdkPixbuf", "2.0")
 
 from gi.repository import Adw, Gdk, GdkPixbuf, GLib, Gtk  # noqa: E402
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from core.asyncio_integration import schedule_async  # noqa: E402
 
 
 class PreviewDialog(Adw.Dialog):
@@ -331,45 +330,30 @@ class PreviewDialog(Adw.Dialog):
             self._on_image_load_failed("No image source available")
             return
 
-        # Load image in background thread
-        def load_in_thread():
+        async def load_image():
             try:
                 if self.thumbnail_cache and self.wallpaper.source.value == "wallhaven":
                     # Use thumbnail cache for remote images
-                    cached = self.thumbnail_cache.get_thumbnail(image_source)
+                    cached = await asyncio.to_thread(
+                        self.thumbnail_cache.get_thumbnail, image_source
+                    )
                     if cached:
                         image_path = str(cached)
                     else:
-                        # For remote images, we need to use async operations
-                        # Import here to avoid circular dependency
-                        import asyncio
-
-                        async def fetch_image():
-                            return str(
-                                await self.thumbnail_cache.download_and_cache(
+                        image_path = str(
+                            await asyncio.wait_for(
+                                self.thumbnail_cache.download_and_cache(
                                     image_source, None
-                                )
-                            )
-
-                        # Create a new event loop for this thread since we're in a background thread
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-                        try:
-                            image_path = loop.run_until_complete(
-                                asyncio.wait_for(fetch_image(), timeout=30)
+                                ),
+                                timeout=30,
                             )
-                        finally:
-                            loop.close()
+                        )
                 else:
                     # Load local file directly
                     image_path = image_source
 
-                # Load as Gdk.Texture
-                from gi.repository import GdkPixbuf
-
-                pixbuf = GdkPixbuf.Pixbuf.new_from_file(str(image_path))
-                texture = Gdk.Texture.new_for_pixbuf(pixbuf)
-                return texture
+                # Decode off the loop; textures are safe to hand to the main thread
+                return await asyncio.to_thread(self._decode_texture, image_path)
             except Exception as e:
                 import logging
 
@@ -386,12 +370,17 @@ class PreviewDialog(Adw.Dialog):
             else:
                 self._on_image_load_failed("Failed to load image")
 
-        def load_and_schedule():
-            result = load_in_thread()
+        async def load_and_schedule():
+            result = await load_image()
             GLib.idle_add(on_loaded, result)
 
-        thread = threading.Thread(target=load_and_schedule, daemon=True)
-        thread.start()
+        # Runs on the shared asyncio loop instead of a thread per preview
+        schedule_async(load_and_schedule())
+
+    @staticmethod
+    def _decode_texture(image_path):
+        pixbuf = GdkPixbuf.Pixbuf.new_from_file(str(image_path))
+        return Gdk.Texture.new_for_pixbuf(pixbuf)
 
     def _load_image_sync(self, image_source):
         """Fallback synchronous image loader."""
@@ -1,10 +1,5 @@
 """Modern Search/Filter Bar component with dropdown, chips, and filter panel."""
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 import gi
 
 gi.require_version("Gtk", "4.0")
@@ -3,7 +3,6 @@
 # ruff: noqa: E402  # gi.repository imports must follow gi.require_version()
 
 import logging
-import sys
 from pathlib import Path
 
 import gi
@@ -13,8 +12,6 @@ gi.require_version("Adw", "1")
 
 from gi.repository import Adw, Gdk, Gio, Gtk  # noqa: E402
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from core.asyncio_integration import schedule_async  # noqa: E402
 from services.banner_service import BannerService
 from services.config_service import ConfigService
@@ -80,8 +77,8 @@ class MainWindow(Adw.Application):
             wallhaven_service=self.wallhaven_service,
             wallpaper_setter=self.wallpaper_setter,
             config_service=self.config_service,
+            favorites_service=self.favorites_service,
         )
-        self.wallhaven_view_model.favorites_service = self.favorites_service
 
         self.local_view_model = LocalViewModel(
             local_service=self.local_service,
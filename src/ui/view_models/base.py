@@ -1,12 +1,8 @@
 """Base ViewModel for UI state management."""
 
-import sys
-from pathlib import Path
-
 import gi
 
 gi.require_version("GObject", "2.0")
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from gi.repository import GObject  # noqa: E402
 
@@ -30,7 +26,8 @@ class BaseViewModel(GObject.Object):
         super().__init__()
         self._is_busy = False
         self._error_message: str | None = None
-        self._selected_wallpapers_list = []
+        # Selected wallpapers keyed by _selection_key, in selection order
+        self._selected: dict = {}
 
     def bind_property(
         self,
@@ -64,17 +61,30 @@ class BaseViewModel(GObject.Object):
         """Clear error message."""
         self.error_message = None
 
+    @staticmethod
+    def _selection_key(wallpaper):
+        """Identity of a wallpaper for selection (remote id, else local path)."""
+        return getattr(wallpaper, "id", None) or wallpaper.path
+
     def _update_selection_state(self) -> None:
-        self.selected_wallpapers = self._selected_wallpapers_list
-        self.selected_count = len(self._selected_wallpapers_list)
+        self.selected_wallpapers = list(self._selected.values())
+        self.selected_count = len(self._selected)
         self.selection_mode = self.selected_count > 0
 
+    def _select_wallpapers(self, wallpapers) -> None:
+        """Replace the selection with the given wallpapers."""
+        self._selected = {self._selection_key(w): w for w in wallpapers}
+        self._update_selection_state()
+
+    def is_selected(self, wallpaper) -> bool:
+        """Check whether a wallpaper is selected."""
+        return self._selection_key(wallpaper) in self._selected
+
     def toggle_selection(self, wallpaper) -> None:
         """Toggle wallpaper selection."""
-        if wallpaper in self._selected_wallpapers_list:
-            self._selected_wallpapers_list.remove(wallpaper)
-        else:
-            self._selected_wallpapers_list.append(wallpaper)
+        key = self._selection_key(wallpaper)
+        if self._selected.pop(key, None) is None:
+            self._selected[key] = wallpaper
         self._update_selection_state()
 
     def select_all(self) -> None:
@@ -84,7 +94,7 @@ class BaseViewModel(GObject.Object):
 
     def deselect_all(self) -> None:
         """Deselect all wallpapers."""
-        self._selected_wallpapers_list.clear()
+        self._selected.clear()
         self._update_selection_state()
 
     def clear_selection(self) -> None:
@@ -94,4 +104,4 @@ class BaseViewModel(GObject.Object):
 
     def get_selected_wallpapers(self) -> list:
         """Get list of selected wallpapers."""
-        return self._selected_wallpapers_list.copy()
+        return list(self._selected.values())
@@ -4,17 +4,14 @@ ViewModel for favorites management
 
 import asyncio
 import logging
-import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from gi.repository import GLib, GObject  # type: ignore
 
 from core.asyncio_integration import get_event_loop, schedule_async
 from domain.favorite import Favorite
 from domain.wallpaper import (
-    Wallpaper,  # noqa: E402
+    Wallpaper,
 )
 from services.config_service import ConfigService
 from services.favorites_service import FavoritesService
@@ -43,6 +40,7 @@ class FavoritesViewModel(BaseViewModel):
 
         self._favorites: list[Favorite] = []
         self._search_query: str = ""
+        self._search_future = None
         self._set_wallpaper_lock = asyncio.Lock()
 
     @GObject.Property(type=object)
@@ -73,10 +71,13 @@ class FavoritesViewModel(BaseViewModel):
     @search_query.setter
     def search_query(self, value: str) -> None:
         self._search_query = value
+        # A newer query supersedes whatever is still filtering
+        if self._search_future is not None:
+            self._search_future.cancel()
         if value:
-            schedule_async(self.search_favorites(value))
+            self._search_future = schedule_async(self.search_favorites(value))
         else:
-            schedule_async(self.load_favorites())
+            self._search_future = schedule_async(self.load_favorites())
 
     async def load_favorites(self) -> None:
         try:
@@ -203,7 +204,7 @@ class FavoritesViewModel(BaseViewModel):
                     if not config:
                         return False, "Configuration not available"
 
-                    filename = f"{wallpaper.id}.{path.rsplit('.', 1)[-1]}"
+                    filename = f"{wallpaper.id}.{wallpaper.extension}"
                     dest_path = (
                         config.local_wallpapers_dir or Path.home() / "Pictures"
                     ) / filename
@@ -256,8 +257,7 @@ class FavoritesViewModel(BaseViewModel):
 
     def select_all(self) -> None:
         """Select all favorites."""
-        self._selected_wallpapers_list = self.wallpapers.copy()
-        self._update_selection_state()
+        self._select_wallpapers(self.wallpapers)
 
     def _show_toast(self, message: str, msg_type: str = "info"):
         try:
@@ -5,23 +5,50 @@ ViewModel for local wallpaper browsing
 import asyncio
 import hashlib
 import shutil
-import sys
 from collections import deque
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from gi.repository import GLib, GObject
 
-from gi.repository import GLib, GObject  # noqa: E402
-
-from core.asyncio_integration import schedule_async  # noqa: E402
-from domain.wallpaper import WallpaperPurity  # noqa: E402
-from services.favorites_service import FavoritesService  # noqa: E402
-from services.local_service import LocalWallpaper, LocalWallpaperService  # noqa: E402
-from services.wallpaper_setter import WallpaperSetter  # noqa: E402
-from ui.view_models.base import BaseViewModel  # noqa: E402
+from core.asyncio_integration import schedule_async
+from domain.wallpaper import (
+    Resolution,
+    Wallpaper,
+    WallpaperPurity,
+    WallpaperSource,
+)
+from services.favorites_service import FavoritesService
+from services.local_service import LocalWallpaper, LocalWallpaperService
+from services.wallpaper_setter import WallpaperSetter
+from ui.view_models.base import BaseViewModel
 
 HASH_CHUNK_SIZE = 65536
 
+_Image = None
+
+
+def _get_image_module():
+    """Import PIL.Image on first use and cache the module."""
+    global _Image
+    if _Image is None:
+        from PIL import Image
+
+        _Image = Image
+    return _Image
+
+
+def _parse_resolution(resolution: str | None) -> tuple[int, int] | None:
+    """Parse a "WIDTHxHEIGHT" string into a (width, height) pair."""
+    if not resolution or not isinstance(resolution, str):
+        return None
+    parts = resolution.split("x")
+    if len(parts) != 2:
+        return None
+    try:
+        return int(parts[0]), int(parts[1])
+    except ValueError:
+        return None
+
 
 class LocalViewModel(BaseViewModel):
     """ViewModel for local wallpaper browsing"""
@@ -35,6 +62,10 @@ class LocalViewModel(BaseViewModel):
 
     # Max concurrent upscaling operations
     MAX_CONCURRENT_UPSCALING = 2
+    # Max wallpapers waiting for an upscaling slot
+    MAX_UPSCALE_QUEUE_SIZE = 256
+    # waifu2x (no RADV driver bugs): 2x scale, denoise level 1, CPU mode
+    UPSCALE_COMMAND = ("waifu2x-ncnn-vulkan", "-s", "2", "-n", "1", "-g", "-1")
     # Max concurrent tagging operations
     MAX_CONCURRENT_TAGGING = 2
 
@@ -55,6 +86,7 @@ class LocalViewModel(BaseViewModel):
         self.config_service = config_service
         self.toast_service = toast_service
         self._wallpapers: list[LocalWallpaper] = []
+        self._by_path: dict[Path, LocalWallpaper] = {}
         self.search_query = ""
         self._current_wallpaper_path: str | None = self._load_last_wallpaper_path()
 
@@ -63,6 +95,7 @@ class LocalViewModel(BaseViewModel):
         self._active_count = 0
         self._completed_count = 0
         self._failed_count = 0
+        self._last_queue_stats = (0, 0)
 
         # Tagging queue system
         self._tag_queue: deque = deque()
@@ -91,9 +124,11 @@ class LocalViewModel(BaseViewModel):
     @wallpapers.setter
     def wallpapers(self, value: list[LocalWallpaper]) -> None:
         self._wallpapers = value
+        self._by_path = {wp.path: wp for wp in value}
 
     def _set_wallpapers(self, wallpapers: list[LocalWallpaper]) -> bool:
         self._wallpapers = wallpapers
+        self._by_path = {wp.path: wp for wp in wallpapers}
         self.notify("wallpapers")
         return False
 
@@ -156,15 +191,25 @@ class LocalViewModel(BaseViewModel):
             return None
 
     def _emit_queue_changed(self):
-        """Emit signal when queue status changes."""
-        self.notify("upscaling-queue-size")
-        self.notify("upscaling-active-count")
-        self.notify("upscaling-total-count")
-        self.emit(
-            "upscaling-queue-changed",
-            len(self._upscale_queue),
-            self._active_count,
-        )
+        """Emit signal when queue status changes.
+
+        Only properties whose value actually changed are notified, and nothing
+        is emitted when the queue stats are the same as last time.
+        """
+        queue_size = len(self._upscale_queue)
+        active_count = self._active_count
+        last_queue_size, last_active_count = self._last_queue_stats
+        if (queue_size, active_count) == self._last_queue_stats:
+            return
+        self._last_queue_stats = (queue_size, active_count)
+
+        if queue_size != last_queue_size:
+            self.notify("upscaling-queue-size")
+        if active_count != last_active_count:
+            self.notify("upscaling-active-count")
+        if queue_size + active_count != last_queue_size + last_active_count:
+            self.notify("upscaling-total-count")
+        self.emit("upscaling-queue-changed", queue_size, active_count)
 
     def _emit_tagging_queue_changed(self):
         """Emit signal when tagging queue status changes."""
@@ -216,10 +261,11 @@ class LocalViewModel(BaseViewModel):
         try:
             self.is_busy = True
             self.error_message = None
-            result = await self.wallpaper_setter.set_wallpaper_async(str(wallpaper.path))
+            path = str(wallpaper.path)
+            result = await self.wallpaper_setter.set_wallpaper_async(path)
             if result:
-                self._current_wallpaper_path = str(wallpaper.path)
-                self._save_last_wallpaper_path(str(wallpaper.path))
+                self._current_wallpaper_path = path
+                self._save_last_wallpaper_path(path)
                 self.notify("current-wallpaper-path")
                 return True, "Wallpaper set successfully"
             return False, "Failed to set wallpaper"
@@ -237,8 +283,11 @@ class LocalViewModel(BaseViewModel):
             result = await self.local_service.delete_wallpaper_async(wallpaper.path)
 
             if result:
-                if wallpaper in self._wallpapers:
-                    self._wallpapers.remove(wallpaper)
+                # Remove the listed instance for this path; the caller may hold
+                # a stale object from before the last reload
+                removed = self._by_path.pop(wallpaper.path, None)
+                if removed is not None:
+                    self._wallpapers.remove(removed)
                     self.notify("wallpapers")
                 return True, f"Deleted '{wallpaper.filename}'"
 
@@ -377,8 +426,7 @@ class LocalViewModel(BaseViewModel):
 
     def select_all(self) -> None:
         """Select all wallpapers."""
-        self._selected_wallpapers_list = self.wallpapers.copy()
-        self._update_selection_state()
+        self._select_wallpapers(self.wallpapers)
 
     async def add_to_favorites(self, wallpaper: LocalWallpaper) -> tuple[bool, str]:
         if self.is_busy:
@@ -392,26 +440,10 @@ class LocalViewModel(BaseViewModel):
             self.is_busy = True
             self.error_message = None
 
-            path_hash = hashlib.sha256(str(wallpaper.path).encode()).hexdigest()[:16]
-            wallpaper_id = f"local_{path_hash}"
-            if await asyncio.to_thread(self.favorites_service.is_favorite, wallpaper_id):
+            # Id lookup, image size and the favorites write all block on disk,
+            # so run them in a single worker thread hop
+            if not await asyncio.to_thread(self._add_favorite_sync, wallpaper):
                 return False, "Already in favorites"
-
-            from domain.wallpaper import Resolution, Wallpaper, WallpaperSource
-
-            width, height = await asyncio.to_thread(self._get_image_size, wallpaper.path)
-
-            wallpaper_domain = Wallpaper(
-                id=wallpaper_id,
-                url=str(wallpaper.path),
-                path=str(wallpaper.path),
-                resolution=Resolution(width=width, height=height),
-                source=WallpaperSource.LOCAL,
-                category="general",
-                purity=WallpaperPurity.SFW,
-            )
-
-            await asyncio.to_thread(self.favorites_service.add_favorite, wallpaper_domain)
             return True, f"Added '{wallpaper.filename}' to favorites"
 
         except Exception as e:
@@ -420,16 +452,36 @@ class LocalViewModel(BaseViewModel):
         finally:
             self.is_busy = False
 
-    def _get_image_size(self, path: Path) -> tuple[int, int]:
-        width, height = 1920, 1080
-        try:
-            from PIL import Image
+    def _add_favorite_sync(self, wallpaper: LocalWallpaper) -> bool:
+        """Store wallpaper as a favorite. Returns False if it already was one."""
+        path_hash = hashlib.sha256(str(wallpaper.path).encode()).hexdigest()[:16]
+        wallpaper_id = f"local_{path_hash}"
+        if self.favorites_service.is_favorite(wallpaper_id):
+            return False
+
+        width, height = self._get_image_size(wallpaper)
+
+        wallpaper_domain = Wallpaper(
+            id=wallpaper_id,
+            url=str(wallpaper.path),
+            path=str(wallpaper.path),
+            resolution=Resolution(width=width, height=height),
+            source=WallpaperSource.LOCAL,
+            category="general",
+            purity=WallpaperPurity.SFW,
+        )
 
-            with Image.open(path) as img:
-                width, height = img.size
-        except (OSError, ValueError):
-            pass
-        return width, height
+        self.favorites_service.add_favorite(wallpaper_domain)
+        return True
+
+    def _get_image_size(self, wallpaper: LocalWallpaper) -> tuple[int, int]:
+        """Get wallpaper dimensions, reusing the cached resolution when known.
+
+        LocalWallpaper.resolution only opens the image if it was never read,
+        so repeated favorites of the same file skip PIL entirely.
+        """
+        size = _parse_resolution(wallpaper.resolution)
+        return size if size else (1920, 1080)
 
     def queue_upscale(self, wallpaper: LocalWallpaper) -> tuple[bool, str]:
         """Queue a wallpaper for upscaling. Non-blocking, supports concurrent operations.
@@ -440,6 +492,9 @@ class LocalViewModel(BaseViewModel):
         Returns:
             Tuple of (queued, message)
         """
+        if len(self._upscale_queue) >= self.MAX_UPSCALE_QUEUE_SIZE:
+            return False, "Upscaling queue is full"
+
         # Add to queue
         self._upscale_queue.append(wallpaper)
 
@@ -478,7 +533,7 @@ class LocalViewModel(BaseViewModel):
         """
         try:
             # Check if waifu2x is available
-            if not shutil.which("waifu2x-ncnn-vulkan"):
+            if not shutil.which(self.UPSCALE_COMMAND[0]):
                 result = False, "waifu2x-ncnn-vulkan not found in PATH"
                 self._finish_upscale(wallpaper, *result)
                 return result
@@ -487,24 +542,16 @@ class LocalViewModel(BaseViewModel):
             # model_path = Path.home() / ".local/lib/realesrgan-ncnn-vulkan/models"
 
             # Create temp file for upscaled image
-            temp_path = (
-                wallpaper.path.parent / f"{wallpaper.path.stem}_upscaled{wallpaper.path.suffix}"
-            )
+            source_path = wallpaper.path
+            temp_path = source_path.with_name(f"{source_path.stem}_upscaled{source_path.suffix}")
 
             try:
-                # Use waifu2x (no RADV driver bugs) with CPU mode
                 process = await asyncio.create_subprocess_exec(
-                    "waifu2x-ncnn-vulkan",
+                    *self.UPSCALE_COMMAND,
                     "-i",
-                    str(wallpaper.path),
+                    str(source_path),
                     "-o",
                     str(temp_path),
-                    "-s",
-                    "2",
-                    "-n",
-                    "1",
-                    "-g",
-                    "-1",  # CPU mode
                     stdout=asyncio.subprocess.PIPE,
                     stderr=asyncio.subprocess.PIPE,
                 )
@@ -535,10 +582,8 @@ class LocalViewModel(BaseViewModel):
 
                 try:
                     # Verify upscaled image is valid before replacing
-                    from PIL import Image
-
                     try:
-                        with Image.open(temp_path) as img:
+                        with _get_image_module().open(temp_path) as img:
                             width, height = img.size
                             if width < 100 or height < 100:
                                 raise ValueError(f"Invalid dimensions: {width}x{height}")
@@ -563,6 +608,9 @@ class LocalViewModel(BaseViewModel):
                     return result
 
                 new_size = wallpaper.path.stat().st_size
+                # Keep the model current so the card can relabel without re-reading the file
+                wallpaper.size = new_size
+                wallpaper.resolution = f"{width}x{height}"
                 size_improvement = (
                     f"({original_size / 1024 / 1024:.1f} MB → {new_size / 1024 / 1024:.1f} MB)"
                 )
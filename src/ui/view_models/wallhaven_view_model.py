@@ -2,30 +2,108 @@
 
 import asyncio
 import logging
-import sys
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, fields, replace
 from pathlib import Path
 
-import gi
 from aiohttp import ClientError
+from gi.repository import GObject
 
-gi.require_version("Gtk", "4.0")
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from gi.repository import GObject  # noqa: E402
-
-from domain.wallpaper import Wallpaper  # noqa: E402
-from services.favorites_service import FavoritesService  # noqa: E402
-from services.wallhaven_service import WallhavenService  # noqa: E402
-from ui.view_models.base import BaseViewModel  # noqa: E402
+from domain.exceptions import ServiceError
+from domain.wallpaper import Wallpaper
+from services.favorites_service import FavoritesService
+from services.wallhaven_service import WallhavenService
+from ui.view_models.base import BaseViewModel
 
 logger = logging.getLogger(__name__)
 
+# In-memory search result cache: entry count and freshness window (seconds)
+SEARCH_CACHE_SIZE = 32
+SEARCH_CACHE_TTL = 300
+
+# Upper bound on simultaneous downloads started by download_many
+MAX_CONCURRENT_DOWNLOADS = 8
+
+
+@dataclass(frozen=True, slots=True)
+class SearchParams:
+    """Wallhaven search filters, named as search_wallpapers arguments.
+
+    Hashable, so a params object keys the page cache and prefetch tasks directly.
+    """
+
+    query: str = ""
+    category: str = "111"
+    purity: str = "100"
+    sorting: str = "toplist"
+    order: str = "desc"
+    resolution: str = ""
+    top_range: str = ""
+    ratios: str = ""
+    colors: str = ""
+    resolutions: str = ""
+    seed: str = ""
+
+    def to_api_kwargs(self) -> dict[str, str]:
+        """Keyword arguments for WallhavenService.search."""
+        return {
+            "query": self.query,
+            "categories": self.category,
+            "purity": self.purity,
+            "sorting": self.sorting,
+            "order": self.order,
+            "atleast": self.resolution,
+            "top_range": self.top_range,
+            "ratios": self.ratios,
+            "colors": self.colors,
+            "resolutions": self.resolutions,
+            "seed": self.seed,
+        }
+
+    @property
+    def is_cacheable(self) -> bool:
+        # Unseeded random results differ per request, so caching them is wrong
+        return not (self.sorting == "random" and not self.seed)
+
+
+_DEFAULT_SEARCH_PARAMS = SearchParams()
+_SEARCH_PARAM_FIELDS = tuple(f.name for f in fields(SearchParams))
+# GObject property exposing each field; only the query is named differently
+_PROPERTY_BY_FIELD = {
+    name: "search-query" if name == "query" else name.replace("_", "-")
+    for name in _SEARCH_PARAM_FIELDS
+}
+
+
+def _search_param(name: str) -> GObject.Property:
+    """Build a string property backed by WallhavenViewModel._params.<name>."""
+
+    def getter(self) -> str:
+        return getattr(self._params, name)
+
+    def setter(self, value: str) -> None:
+        if getattr(self._params, name) != value:
+            self._params = replace(self._params, **{name: value})
+            # Setters run on the GTK thread; prefetch tasks belong to the asyncio loop
+            if self._prefetch_loop is not None:
+                self._prefetch_loop.call_soon_threadsafe(self._drop_stale_prefetches)
+
+    return GObject.Property(
+        type=str,
+        default=getattr(_DEFAULT_SEARCH_PARAMS, name),
+        getter=getter,
+        setter=setter,
+    )
+
 
 class WallhavenViewModel(BaseViewModel):
     """ViewModel for Wallhaven wallpaper browsing"""
 
     __gsignals__ = {
         "wallpaper-downloaded": (GObject.SignalFlags.RUN_FIRST, None, (str,)),
+        # (position, wallpapers) appended to the current results in place
+        "items-added": (GObject.SignalFlags.RUN_FIRST, None, (int, object)),
     }
 
     def __init__(
@@ -33,42 +111,53 @@ class WallhavenViewModel(BaseViewModel):
         wallhaven_service: WallhavenService,
         wallpaper_setter,
         config_service,
+        favorites_service: FavoritesService | None = None,
     ) -> None:
         super().__init__()
         self.wallhaven_service = wallhaven_service
         self.wallpaper_setter = wallpaper_setter
         self.config_service = config_service
-        self.favorites_service: FavoritesService | None = None
+        self.favorites_service = favorites_service
 
         self._wallpapers: list[Wallpaper] = []
+        self._thumb_urls: list[str] = []
         self._current_page = 1
         self._total_pages = 1
         self._total_wallpapers = 0
-        self._search_query = ""
-        self._category = "111"
-        self._purity = "100"
-        self._sorting = "toplist"
-        self._order = "desc"
-        self._resolution = ""
-        self._top_range = ""
-        self._ratios = ""
-        self._colors = ""
-        self._resolutions = ""
-        self._seed = ""
+        self._params = _DEFAULT_SEARCH_PARAMS
 
         # Async lock to prevent concurrent searches
         self._search_lock = asyncio.Lock()
+        # Task running the latest search and its arguments, so it can be superseded
+        self._current_search: asyncio.Task | None = None
+        self._current_request: tuple | None = None
 
         # Async lock to prevent concurrent add_to_favorites operations
         self._add_to_favorites_lock = asyncio.Lock()
 
+        # Recent result pages keyed by (SearchParams, page), oldest first
+        self._search_cache: OrderedDict[
+            tuple[SearchParams, int], tuple[list[Wallpaper], dict, float]
+        ] = OrderedDict()
+        self._prefetch_tasks: dict[tuple[SearchParams, int], asyncio.Task] = {}
+        # Loop the prefetch tasks run on, set once the first one is scheduled
+        self._prefetch_loop: asyncio.AbstractEventLoop | None = None
+
     @GObject.Property(type=object)
     def wallpapers(self) -> list[Wallpaper]:
         return self._wallpapers
 
     @wallpapers.setter
     def wallpapers(self, value: list[Wallpaper]) -> None:
-        self._wallpapers = value
+        # Own the list so appending a page never mutates a cached one
+        self._wallpapers = list(value)
+        # Parallel to wallpapers, so grid rebuilds index flat strings
+        self._thumb_urls = [w.thumbs_large or w.thumbs_small for w in value]
+
+    @property
+    def thumbnail_urls(self) -> list[str]:
+        """Best available thumbnail URL per wallpaper, by position."""
+        return self._thumb_urls
 
     @GObject.Property(type=int, default=1)
     def current_page(self) -> int:
@@ -94,110 +183,23 @@ class WallhavenViewModel(BaseViewModel):
     def total_wallpapers(self, value: int) -> None:
         self._total_wallpapers = value
 
-    @GObject.Property(type=str, default="")
-    def search_query(self) -> str:
-        return self._search_query
-
-    @search_query.setter
-    def search_query(self, value: str) -> None:
-        self._search_query = value
-
-    @GObject.Property(type=str, default="111")
-    def category(self) -> str:
-        return self._category
-
-    @category.setter
-    def category(self, value: str) -> None:
-        self._category = value
-
-    @GObject.Property(type=str, default="100")
-    def purity(self) -> str:
-        return self._purity
-
-    @purity.setter
-    def purity(self, value: str) -> None:
-        self._purity = value
-
-    @GObject.Property(type=str, default="toplist")
-    def sorting(self) -> str:
-        return self._sorting
-
-    @sorting.setter
-    def sorting(self, value: str) -> None:
-        self._sorting = value
-
-    @GObject.Property(type=str, default="desc")
-    def order(self) -> str:
-        return self._order
-
-    @order.setter
-    def order(self, value: str) -> None:
-        self._order = value
-
-    @GObject.Property(type=str, default="")
-    def resolution(self) -> str:
-        return self._resolution
-
-    @resolution.setter
-    def resolution(self, value: str) -> None:
-        self._resolution = value
-
-    @GObject.Property(type=str, default="")
-    def top_range(self) -> str:
-        return self._top_range
-
-    @top_range.setter
-    def top_range(self, value: str) -> None:
-        self._top_range = value
-
-    @GObject.Property(type=str, default="")
-    def ratios(self) -> str:
-        return self._ratios
-
-    @ratios.setter
-    def ratios(self, value: str) -> None:
-        self._ratios = value
-
-    @GObject.Property(type=str, default="")
-    def colors(self) -> str:
-        return self._colors
-
-    @colors.setter
-    def colors(self, value: str) -> None:
-        self._colors = value
-
-    @GObject.Property(type=str, default="")
-    def resolutions(self) -> str:
-        return self._resolutions
-
-    @resolutions.setter
-    def resolutions(self, value: str) -> None:
-        self._resolutions = value
-
-    @GObject.Property(type=str, default="")
-    def seed(self) -> str:
-        return self._seed
-
-    @seed.setter
-    def seed(self, value: str) -> None:
-        self._seed = value
+    search_query = _search_param("query")
+    category = _search_param("category")
+    purity = _search_param("purity")
+    sorting = _search_param("sorting")
+    order = _search_param("order")
+    resolution = _search_param("resolution")
+    top_range = _search_param("top_range")
+    ratios = _search_param("ratios")
+    colors = _search_param("colors")
+    resolutions = _search_param("resolutions")
+    seed = _search_param("seed")
 
     async def load_initial_wallpapers(self) -> None:
         """Load initial wallpapers with current parameters"""
         logger.info("Loading initial Wallhaven wallpapers")
-        await self.search_wallpapers(
-            query=self.search_query,
-            page=1,
-            category=self.category,
-            purity="100",
-            sorting=self.sorting,
-            order="desc",
-            resolution="",
-            top_range=self.top_range,
-            ratios=self.ratios,
-            colors=self.colors,
-            resolutions=self.resolutions,
-            seed=self.seed,
+        await self._search(
+            replace(self._params, purity="100", order="desc", resolution="")
         )
         logger.info(f"Loaded {len(self.wallpapers)} wallpapers")
 
@@ -217,133 +219,228 @@ class WallhavenViewModel(BaseViewModel):
         seed: str = "",
         append_results: bool = False,
     ) -> None:
-        """Search wallpapers on Wallhaven with concurrent search protection"""
-        # Try to acquire lock - if another search is running, skip this one
-        if self._search_lock.locked():
-            logger.debug(
-                "Search already in progress, skipping concurrent search request"
-            )
-            return
+        """Search wallpapers on Wallhaven, superseding any search still in flight"""
+        params = SearchParams(
+            query=query,
+            category=category,
+            purity=purity,
+            sorting=sorting,
+            order=order,
+            resolution=resolution,
+            top_range=top_range,
+            ratios=ratios,
+            colors=colors,
+            resolutions=resolutions,
+            seed=seed,
+        )
+        await self._search(params, page, append_results)
+
+    async def _search(
+        self, params: SearchParams, page: int = 1, append_results: bool = False
+    ) -> None:
+        request = (params, page, append_results)
+        previous = self._current_search
+        if previous is not None and not previous.done():
+            if request == self._current_request:
+                # Single-flight: share the running request instead of repeating it
+                logger.debug("Identical search already in progress, joining it")
+                await asyncio.wait({previous})
+                return
+            # The newest filters win; abort the stale fetch mid-flight
+            logger.debug("Cancelling superseded search")
+            previous.cancel()
+
+        # The fetch runs in a task owned by the view model, so superseding it
+        # never cancels whatever the caller does after the search returns
+        search = asyncio.create_task(self._run_search(params, page, append_results))
+        self._current_search = search
+        self._current_request = request
+        try:
+            await asyncio.wait({search})
+        except asyncio.CancelledError:
+            search.cancel()
+            raise
+        finally:
+            if self._current_search is search:
+                self._current_search = None
+
+        if not search.cancelled() and search.result():
+            self._schedule_prefetch(params)
 
+    async def _run_search(self, params: SearchParams, page: int, append_results: bool) -> bool:
+        """Fetch and publish a result page; returns whether it succeeded."""
         async with self._search_lock:
             try:
                 self.is_busy = True
                 self.error_message = None
-                self.search_query = query
-                self.category = category
-                self.purity = purity
-                self.sorting = sorting
-                self.order = order
-                self.resolution = resolution
-                self.top_range = top_range
-                self.ratios = ratios
-                self.colors = colors
-                self.resolutions = resolutions
-                self.seed = seed
+                self._set_params(params)
 
                 logger.debug(
-                    f"Starting search: query='{query}', category={category}, page={page}"
+                    f"Starting search: query='{params.query}', "
+                    f"category={params.category}, page={page}"
                 )
 
-                wallpapers, meta = await self.wallhaven_service.search(
-                    query=query,
-                    page=page,
-                    categories=category,
-                    purity=purity,
-                    sorting=sorting,
-                    order=order,
-                    atleast=resolution,
-                    top_range=top_range,
-                    ratios=ratios,
-                    colors=colors,
-                    resolutions=resolutions,
-                    seed=seed,
-                )
+                wallpapers, meta = await self._fetch_page(params, page)
 
-                if append_results and self.wallpapers:
-                    self.wallpapers = self.wallpapers + wallpapers
-                else:
-                    self.wallpapers = wallpapers
+                # Handlers of notify::wallpapers see the page counters already updated
+                with self.freeze_notify():
+                    if append_results and self._wallpapers:
+                        self._append_wallpapers(wallpapers)
+                    else:
+                        self.wallpapers = wallpapers
 
-                self.current_page = meta.get("current_page", page)
-                self.total_pages = meta.get("last_page", page + 1)
-                self.total_wallpapers = meta.get("total", 0)
+                    self.current_page = meta.get("current_page", page)
+                    self.total_pages = meta.get("last_page", page + 1)
+                    self.total_wallpapers = meta.get("total", 0)
 
                 logger.debug(
                     f"Search completed: {len(wallpapers)} wallpapers, page {self.current_page}/{self.total_pages}"
                 )
+                return True
 
             except (ClientError, ValueError, OSError, Exception) as e:
                 error_msg = f"Failed to search wallpapers: {e}"
                 self.error_message = error_msg
                 self.wallpapers = []
                 logger.error(error_msg, exc_info=True)
+                return False
             finally:
                 self.is_busy = False
 
+    def _set_params(self, params: SearchParams) -> None:
+        """Adopt new search filters, notifying only the properties that changed."""
+        previous, self._params = self._params, params
+        if previous == params:
+            return
+        # Queue notifications and emit them together once all are set
+        with self.freeze_notify():
+            for name in _SEARCH_PARAM_FIELDS:
+                if getattr(previous, name) != getattr(params, name):
+                    self.notify(_PROPERTY_BY_FIELD[name])
+
+    def _append_wallpapers(self, wallpapers: list[Wallpaper]) -> None:
+        """Extend the results in place and announce only the new items."""
+        position = len(self._wallpapers)
+        self._wallpapers.extend(wallpapers)
+        self._thumb_urls.extend(w.thumbs_large or w.thumbs_small for w in wallpapers)
+        self.emit("items-added", position, wallpapers)
+
+    def _drop_stale_prefetches(self, params: SearchParams | None = None) -> None:
+        """Abort background page fetches for filters other than params (loop thread)."""
+        params = self._params if params is None else params
+        for key in list(self._prefetch_tasks):
+            if key[0] != params:
+                self._prefetch_tasks.pop(key).cancel()
+
+    async def _fetch_page(
+        self, params: SearchParams, page: int
+    ) -> tuple[list[Wallpaper], dict]:
+        """Get a result page from the cache or a prefetch, falling back to the API."""
+        key = (params, page)
+
+        # Drop prefetches that belong to a different search
+        self._drop_stale_prefetches(params)
+
+        pending = self._prefetch_tasks.get(key)
+        if pending is not None:
+            await asyncio.wait({pending})
+
+        cached = self._get_cached_page(key)
+        if cached is not None:
+            logger.debug(f"Serving page {page} from search cache")
+            return cached
+
+        result = await self.wallhaven_service.search(page=page, **params.to_api_kwargs())
+        if params.is_cacheable:
+            self._cache_page(key, result)
+        return result
+
+    def _get_cached_page(self, key: tuple) -> tuple[list[Wallpaper], dict] | None:
+        entry = self._search_cache.get(key)
+        if entry is None:
+            return None
+
+        wallpapers, meta, fetched_at = entry
+        if time.monotonic() - fetched_at >= SEARCH_CACHE_TTL:
+            del self._search_cache[key]
+            return None
+
+        self._search_cache.move_to_end(key)
+        return wallpapers, meta
+
+    def _cache_page(self, key: tuple, result: tuple[list[Wallpaper], dict]) -> None:
+        wallpapers, meta = result
+        self._search_cache[key] = (wallpapers, meta, time.monotonic())
+        self._search_cache.move_to_end(key)
+        while len(self._search_cache) > SEARCH_CACHE_SIZE:
+            self._search_cache.popitem(last=False)
+
+    def _schedule_prefetch(self, params: SearchParams) -> None:
+        """Prefetch the next page in the background."""
+        if not params.is_cacheable:
+            return
+
+        next_page = self.current_page + 1
+        key = (params, next_page)
+        if (
+            next_page > self.total_pages
+            or key in self._prefetch_tasks
+            or self._get_cached_page(key) is not None
+        ):
+            return
+
+        self._prefetch_loop = asyncio.get_running_loop()
+        self._prefetch_tasks[key] = asyncio.create_task(
+            self._prefetch_page(key, params, next_page)
+        )
+
+    async def _prefetch_page(self, key: tuple, params: SearchParams, page: int) -> None:
+        try:
+            result = await self.wallhaven_service.search(
+                page=page, **params.to_api_kwargs()
+            )
+            self._cache_page(key, result)
+            logger.debug(f"Prefetched page {page}")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.debug(f"Prefetch of page {page} failed: {e}")
+        finally:
+            self._prefetch_tasks.pop(key, None)
+
     async def load_next_page(self) -> None:
         """Load next page of wallpapers"""
         if self.current_page < self.total_pages:
-            await self.search_wallpapers(
-                query=self.search_query,
-                page=self.current_page + 1,
-                category=self.category,
-                purity=self.purity,
-                sorting=self.sorting,
-                order=self.order,
-                resolution=self.resolution,
-                top_range=self.top_range,
-                ratios=self.ratios,
-                colors=self.colors,
-                resolutions=self.resolutions,
-                seed=self.seed,
-                append_results=False,
-            )
+            await self._search(self._params, self.current_page + 1)
 
     async def load_prev_page(self) -> None:
         """Load previous page of wallpapers"""
         target_page = self.current_page - 1
         if target_page >= 1:
-            await self.search_wallpapers(
-                query=self.search_query,
-                page=target_page,
-                category=self.category,
-                purity=self.purity,
-                sorting=self.sorting,
-                order=self.order,
-                resolution=self.resolution,
-                top_range=self.top_range,
-                ratios=self.ratios,
-                colors=self.colors,
-                resolutions=self.resolutions,
-                seed=self.seed,
-                append_results=False,
-            )
+            await self._search(self._params, target_page)
+
+    # Pagination checks read the backing fields directly rather than going
+    # through GObject property dispatch on every call
 
     def has_next_page(self) -> bool:
         """Check if there's a next page"""
-        return self.current_page < self.total_pages
+        return self._current_page < self._total_pages
 
     def has_prev_page(self) -> bool:
         """Check if there's a previous page"""
-        return self.current_page > 1
+        return self._current_page > 1
 
     def select_all(self) -> None:
         """Select all wallpapers."""
-        self._selected_wallpapers_list = self.wallpapers.copy()
-        self._update_selection_state()
+        self._select_wallpapers(self.wallpapers)
 
-    def can_load_next_page(self) -> bool:
-        """Check if there's a next page available"""
-        return self.current_page < self.total_pages
-
-    def can_load_prev_page(self) -> bool:
-        """Check if there's a previous page available"""
-        return self.current_page > 1
+    can_load_next_page = has_next_page
+    can_load_prev_page = has_prev_page
 
     def can_navigate(self) -> bool:
         """Check if pagination navigation is available"""
-        return self.has_next_page() or self.has_prev_page()
+        current_page = self._current_page
+        return current_page < self._total_pages or current_page > 1
 
     async def set_wallpaper(self, wallpaper: Wallpaper) -> tuple[bool, str]:
         try:
@@ -372,20 +469,44 @@ class WallhavenViewModel(BaseViewModel):
 
         async with self._add_to_favorites_lock:
             try:
-                self.is_busy = True
-                self.error_message = None
-
+                # Duplicates return before touching busy state, so no spinner blip
                 if await asyncio.to_thread(
                     self.favorites_service.is_favorite, wallpaper.id
                 ):
                     return False, "Already in favorites"
 
+                self.is_busy = True
+                self.error_message = None
+
                 await asyncio.to_thread(self.favorites_service.add_favorite, wallpaper)
                 return True, "Added to favorites"
 
             except (ValueError, OSError) as e:
                 self.error_message = f"Failed to add to favorites: {e}"
                 return False, f"Failed to add to favorites: {e}"
+            finally:
+                if self.is_busy:
+                    self.is_busy = False
+
+    async def add_many_to_favorites(self, wallpapers: list[Wallpaper]) -> tuple[bool, str]:
+        """Add several wallpapers to favorites in one write. Returns (success, message)."""
+        if not self.favorites_service:
+            self.error_message = "Favorites service not available"
+            return False, "Favorites service not available"
+
+        async with self._add_to_favorites_lock:
+            try:
+                self.is_busy = True
+                self.error_message = None
+
+                added = await asyncio.to_thread(
+                    self.favorites_service.add_favorites, wallpapers
+                )
+                return True, f"Added {added} wallpapers to favorites"
+
+            except (ValueError, OSError, ServiceError) as e:
+                self.error_message = f"Failed to add to favorites: {e}"
+                return False, f"Failed to add to favorites: {e}"
             finally:
                 self.is_busy = False
 
@@ -433,21 +554,61 @@ class WallhavenViewModel(BaseViewModel):
         finally:
             self.is_busy = False
 
+    async def download_many(self, wallpapers: list[Wallpaper]) -> list[str | None]:
+        """Download several wallpapers concurrently.
+
+        Returns the local path (or None on failure) for each wallpaper, in order.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+
+        async def bounded_download(wallpaper: Wallpaper) -> str | None:
+            async with semaphore:
+                return await self._download(wallpaper)
+
+        # One busy cycle for the whole batch rather than one per wallpaper
+        self.is_busy = True
+        try:
+            results = await asyncio.gather(
+                *(bounded_download(w) for w in wallpapers), return_exceptions=True
+            )
+        finally:
+            self.is_busy = False
+
+        paths = []
+        for wallpaper, result in zip(wallpapers, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to download {wallpaper.id}: {result}")
+                result = None
+            paths.append(result)
+        return paths
+
+    @staticmethod
+    def _is_downloaded(dest_path: Path) -> bool:
+        try:
+            return dest_path.stat().st_size > 0
+        except OSError:
+            return False
+
     async def download_wallpaper(self, wallpaper: Wallpaper) -> str | None:
         """Download wallpaper and return the local path, or None on failure."""
-        config = self.config_service.get_config()
+        try:
+            self.is_busy = True
+            return await self._download(wallpaper)
+        finally:
+            self.is_busy = False
 
+    async def _download(self, wallpaper: Wallpaper) -> str | None:
         if not wallpaper.url:
             return None
 
         try:
-            self.is_busy = True
-
-            filename = f"{wallpaper.id}.{wallpaper.path.rsplit('.', 1)[-1]}"
+            # ConfigService memoizes the loaded config, so this is a plain lookup
+            config = self.config_service.get_config()
+            filename = f"{wallpaper.id}.{wallpaper.extension}"
             dest_path = config.local_wallpapers_dir / filename
 
-            # Check if already downloaded
-            if dest_path.exists():
+            # Reuse a previous download; an empty file is a leftover from a failed one
+            if await asyncio.to_thread(self._is_downloaded, dest_path):
                 logger.info(f"Wallpaper {wallpaper.id} already exists at {dest_path}")
                 return str(dest_path)
 
@@ -462,10 +623,6 @@ class WallhavenViewModel(BaseViewModel):
                 return None
 
         except (ClientError, OSError, ValueError) as e:
-            import traceback
-
-            traceback.print_exc()
+            logger.exception(f"Download error for {wallpaper.id}")
             self.error_message = f"Download error: {e}"
             return None
-        finally:
-            self.is_busy = False
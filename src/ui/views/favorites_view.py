@@ -1,21 +1,43 @@
 """View for favorites management."""
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from collections import OrderedDict
 
 import gi
 
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
 
-from gi.repository import Adw, Gdk, GLib, Gtk, Pango  # noqa: E402
+from gi.repository import Adw, Gdk, Gio, GLib, GObject, Gtk, Pango  # noqa: E402
 
 from core.asyncio_integration import schedule_async  # noqa: E402
 from ui.components.search_filter_bar import SearchFilterBar  # noqa: E402
 from ui.view_models.favorites_view_model import FavoritesViewModel  # noqa: E402
 
+# Decoded thumbnails kept for cards scrolled out of view
+TEXTURE_CACHE_SIZE = 256
+
+# Grid key -> FavoritesView method, resolved once at import
+_GRID_KEY_HANDLERS = {
+    Gdk.KEY_Down: "_focus_next_card",
+    Gdk.KEY_Right: "_focus_next_card",
+    Gdk.KEY_Up: "_focus_prev_card",
+    Gdk.KEY_Left: "_focus_prev_card",
+    Gdk.KEY_Return: "_activate_focused_card",
+    Gdk.KEY_KP_Enter: "_activate_focused_card",
+    Gdk.KEY_space: "_remove_focused_favorite",
+    Gdk.KEY_Escape: "_clear_selection",
+}
+
+
+class _FavoriteItem(GObject.Object):
+    """Grid model item wrapping a Favorite."""
+
+    __gtype_name__ = "FavoritesViewItem"
+
+    def __init__(self, favorite):
+        super().__init__()
+        self.favorite = favorite
+
 
 class FavoritesView(Adw.Bin):
     """View for favorites wallpaper browsing with adaptive layout"""
@@ -36,8 +58,19 @@ class FavoritesView(Adw.Bin):
         self.thumbnail_loader = thumbnail_loader
         self.on_set_wallpaper = on_set_wallpaper
         self.on_remove_favorite = on_remove_favorite
-        self.card_wallpaper_map = {}
         self._last_selected_wallpaper = None
+        self._cards_by_id: dict[str, Gtk.Widget] = {}
+        # Grid position by wallpaper id, for O(1) keyboard navigation
+        self._store_index: dict[str, int] = {}
+        # Recently shown thumbnails by path (LRU), so rebound cards don't reload them
+        self._textures: OrderedDict[str, Gdk.Texture] = OrderedDict()
+        self._thumbnail_requests: list = []
+        # In-flight thumbnail loads by path, cancelled when their favorite leaves
+        self._thumbnail_futures: dict = {}
+        self._thumbnail_flush_pending = False
+        # Reused confirmation dialog and the favorite it is asking about
+        self._remove_dialog: Adw.MessageDialog | None = None
+        self._pending_remove_id: str | None = None
 
         self._create_ui()
 
@@ -72,6 +105,10 @@ class FavoritesView(Adw.Bin):
 
     def _on_search_changed(self, search_text):
         """Handle search text changes."""
+        # SearchFilterBar already debounces; a burst that ends where it
+        # started (type then backspace) needs no new search
+        if search_text == self.view_model.search_query:
+            return
         self.view_model.search_query = search_text
 
     def _create_wallpapers_grid(self):
@@ -79,14 +116,27 @@ class FavoritesView(Adw.Bin):
         self.scroll = Gtk.ScrolledWindow()
         self.scroll.set_vexpand(True)
 
-        # Create flow box for wallpapers grid
-        self.wallpapers_grid = Gtk.FlowBox()
-        self.wallpapers_grid.set_homogeneous(True)
-        self.wallpapers_grid.set_min_children_per_line(4)
-        self.wallpapers_grid.set_max_children_per_line(12)
-        self.wallpapers_grid.set_column_spacing(12)
-        self.wallpapers_grid.set_row_spacing(12)
-        self.wallpapers_grid.set_selection_mode(Gtk.SelectionMode.NONE)
+        # The grid view only instantiates cards for visible rows and recycles
+        # them while scrolling; updates splice the store instead of rebuilding
+        self._store = Gio.ListStore.new(_FavoriteItem)
+
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self._on_card_setup)
+        factory.connect("bind", self._on_card_bind)
+        factory.connect("unbind", self._on_card_unbind)
+
+        self.wallpapers_grid = Gtk.GridView(
+            model=Gtk.NoSelection(model=self._store), factory=factory
+        )
+        self.wallpapers_grid.set_min_columns(4)
+        self.wallpapers_grid.set_max_columns(12)
+        self.wallpapers_grid.add_css_class("wallpapers-grid")
+
+        # One click gesture for the whole grid; the card is found by picking
+        gesture = Gtk.GestureClick(button=1)
+        gesture.connect("pressed", self._on_grid_pressed)
+        self.wallpapers_grid.add_controller(gesture)
+
         self.scroll.set_child(self.wallpapers_grid)
 
         self.main_box.append(self.scroll)
@@ -123,9 +173,6 @@ class FavoritesView(Adw.Bin):
         grid_key_controller.connect("key-pressed", self._on_grid_key_pressed)
         self.wallpapers_grid.add_controller(grid_key_controller)
 
-        # Track card->wallpaper mapping for keyboard activation
-        self.card_wallpaper_map = {}
-
     def _on_key_pressed(self, controller, keyval, keycode, state):
         """Handle keyboard shortcuts at view level."""
         if state & Gdk.ModifierType.CONTROL_MASK and keyval == Gdk.KEY_a:
@@ -137,103 +184,73 @@ class FavoritesView(Adw.Bin):
         return False
 
     def _on_grid_key_pressed(self, controller, keyval, keycode, state):
-        if keyval == Gdk.KEY_Down:
-            self._focus_next_card()
-            return True
-        elif keyval == Gdk.KEY_Up:
-            self._focus_prev_card()
-            return True
-        elif keyval == Gdk.KEY_Right:
-            self._focus_next_card()
-            return True
-        elif keyval == Gdk.KEY_Left:
-            self._focus_prev_card()
-            return True
-        elif keyval in (Gdk.KEY_Return, Gdk.KEY_KP_Enter):
-            focused = self.wallpapers_grid.get_focus_child()
-            if focused and focused in self.card_wallpaper_map:
-                wallpaper = self.card_wallpaper_map[focused]
-                for favorite in self.view_model.favorites:
-                    if favorite.wallpaper.id == wallpaper.id:
-
-                        async def perform_set(fav=favorite):
-                            success, message = (
-                                await self.view_model.set_wallpaper_async(fav)
-                            )
-                            if not self.toast_service:
-                                return
-                            if success:
-                                self.toast_service.show_toast(message, "success")
-                            else:
-                                self.toast_service.show_toast(message, "error")
-
-                        self._run_async(perform_set())
-                        break
-            return True
-        elif keyval == Gdk.KEY_space:
-            focused = self.wallpapers_grid.get_focus_child()
-            if focused and focused in self.card_wallpaper_map:
-                wallpaper = self.card_wallpaper_map[focused]
+        handler = _GRID_KEY_HANDLERS.get(keyval)
+        if handler is None:
+            return False
+        getattr(self, handler)()
+        return True
 
-                async def remove_favorite():
-                    await self.view_model.remove_favorite(wallpaper.id)
+    def _activate_focused_card(self):
+        focused = self._get_focused_card()
+        favorite = focused.favorite if focused else None
+        if favorite is None:
+            return
 
-                self._run_async(remove_favorite())
-            return True
-        elif keyval == Gdk.KEY_Escape:
-            self.view_model.clear_selection()
-            return True
-        return False
+        async def perform_set():
+            success, message = await self.view_model.set_wallpaper_async(favorite)
+            if not self.toast_service:
+                return
+            if success:
+                self.toast_service.show_toast(message, "success")
+            else:
+                self.toast_service.show_toast(message, "error")
 
-    def _focus_next_card(self):
-        """Focus next card in grid."""
-        current = self.wallpapers_grid.get_focus_child()
-        if not current:
-            # Focus first card if none focused
-            first = self.wallpapers_grid.get_first_child()
-            if first:
-                first.grab_focus()
+        self._run_async(perform_set())
+
+    def _remove_focused_favorite(self):
+        focused = self._get_focused_card()
+        favorite = focused.favorite if focused else None
+        if favorite is None:
             return
 
-        # Get all children
-        children = []
-        child = self.wallpapers_grid.get_first_child()
-        while child:
-            children.append(child)
-            child = child.get_next_sibling()
+        async def remove_favorite():
+            await self.view_model.remove_favorite(favorite.wallpaper_id)
 
-        if not children:
-            return
+        self._run_async(remove_favorite())
+
+    def _clear_selection(self):
+        self.view_model.clear_selection()
 
-        current_idx = children.index(current)
-        next_idx = (current_idx + 1) % len(children)
-        children[next_idx].grab_focus()
+    def _get_focused_card(self):
+        """Return the card inside the focused grid cell, if any."""
+        cell = self.wallpapers_grid.get_focus_child()
+        return cell.get_first_child() if cell else None
+
+    def _focus_next_card(self):
+        """Focus next card in grid."""
+        self._focus_card_at_offset(1)
 
     def _focus_prev_card(self):
         """Focus previous card in grid."""
-        current = self.wallpapers_grid.get_focus_child()
-        if not current:
-            # Focus last card if none focused
-            last = self.wallpapers_grid.get_first_child()
-            while last and last.get_next_sibling():
-                last = last.get_next_sibling()
-            if last:
-                last.grab_focus()
-            return
-
-        # Get all children
-        children = []
-        child = self.wallpapers_grid.get_first_child()
-        while child:
-            children.append(child)
-            child = child.get_next_sibling()
+        self._focus_card_at_offset(-1)
 
-        if not children:
+    def _focus_card_at_offset(self, offset):
+        n_items = self._store.get_n_items()
+        if not n_items:
             return
 
-        current_idx = children.index(current)
-        prev_idx = (current_idx - 1) % len(children)
-        children[prev_idx].grab_focus()
+        card = self._get_focused_card()
+        index = None
+        if card is not None and card.favorite is not None:
+            index = self._store_index.get(card.favorite.wallpaper_id)
+
+        if index is None:
+            # Nothing focused yet: start from the matching end of the grid
+            target = 0 if offset > 0 else n_items - 1
+        else:
+            target = (index + offset) % n_items
+        # Scrolls the target into view first, so it works for unrealized cells too
+        self.wallpapers_grid.scroll_to(target, Gtk.ListScrollFlags.FOCUS, None)
 
     def _setup_pull_to_refresh(self):
         """Setup pull-to-refresh gesture on scrolled window."""
@@ -302,141 +319,234 @@ class FavoritesView(Adw.Bin):
         """Handle error message changes"""
         # Error handling can be added here if needed
 
+    def update_status(self):
+        """Update status bar"""
+        count = len(self.view_model.favorites)
+        self.status_label.set_text(f"{count} favorites")
+
     def update_wallpapers_grid(self):
         """Update wallpapers grid display"""
 
-        def clear_and_update():
-            while self.wallpapers_grid.get_first_child():
-                self.wallpapers_grid.remove(self.wallpapers_grid.get_first_child())
-
-            self.card_wallpaper_map.clear()
-
-            for favorite in self.view_model.favorites:
-                card = self._create_wallpaper_card(favorite)
-                self.wallpapers_grid.append(card)
-
+        def apply_changes():
+            self._sync_store(self.view_model.favorites)
+            self._refresh_selection_classes()
             return False
 
-        GLib.idle_add(clear_and_update)
-
-    def update_status(self):
-        """Update status bar"""
-        count = len(self.view_model.favorites)
-        self.status_label.set_text(f"{count} favorites")
+        GLib.idle_add(apply_changes)
+
+    def _sync_store(self, favorites):
+        """Splice only the changed run of favorites into the grid model."""
+        old_ids = [item.favorite.wallpaper_id for item in self._store]
+        new_ids = [favorite.wallpaper_id for favorite in favorites]
+
+        # Items matching at both ends keep their cards
+        limit = min(len(old_ids), len(new_ids))
+        start = 0
+        while start < limit and old_ids[start] == new_ids[start]:
+            start += 1
+        end = 0
+        while end < limit - start and old_ids[-1 - end] == new_ids[-1 - end]:
+            end += 1
+
+        n_removed = len(old_ids) - start - end
+        added = favorites[start : len(new_ids) - end]
+        if not n_removed and not added:
+            return
 
-    def _create_wallpaper_card(self, favorite):
-        """Create wallpaper card with image and actions"""
-        card = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
-        card.set_hexpand(True)
-        card.add_css_class("wallpaper-card")
+        for position in range(start, start + n_removed):
+            self._textures.pop(str(self._store[position].favorite.wallpaper.path), None)
 
-        # Make card focusable
-        card.set_can_focus(True)
-        card.set_focusable(True)
+        self._store.splice(start, n_removed, [_FavoriteItem(f) for f in added])
+        self._store_index = {wallpaper_id: i for i, wallpaper_id in enumerate(new_ids)}
 
-        # Store mapping for keyboard activation
-        self.card_wallpaper_map[card] = favorite.wallpaper
+    def _refresh_selection_classes(self):
+        for card in self._cards_by_id.values():
+            self._apply_selection_classes(card)
 
-        wallpaper = favorite.wallpaper
-        is_selected = wallpaper in self.view_model.get_selected_wallpapers()
-        if is_selected:
+    def _apply_selection_classes(self, card):
+        if self.view_model.is_selected(card.favorite.wallpaper):
             card.add_css_class("selected")
+        else:
+            card.remove_css_class("selected")
         if self.view_model.selection_mode:
             card.add_css_class("selection-mode")
+        else:
+            card.remove_css_class("selection-mode")
 
-        gesture = Gtk.GestureClick()
-        gesture.set_button(1)
-        gesture.connect("pressed", self._on_card_clicked, favorite, card)
-        card.add_controller(gesture)
+    def _on_card_setup(self, factory, list_item):
+        list_item.set_child(self._build_wallpaper_card())
 
-        image = Gtk.Picture()
-        image.set_size_request(200, 160)
-        image.set_content_fit(Gtk.ContentFit.CONTAIN)
-        image.add_css_class("wallpaper-thumb")
-        image.set_tooltip_text(
-            Path(wallpaper.path).name if hasattr(wallpaper, "path") else "Favorite"
+    def _on_card_bind(self, factory, list_item):
+        card = list_item.get_child()
+        self._bind_wallpaper_card(
+            card, list_item.get_item().favorite, self._thumbnail_requests
         )
-
-        def on_thumbnail_loaded(texture):
-            if texture:
-                image.set_paintable(texture)
-
-        if self.thumbnail_loader:
-            self.thumbnail_loader.load_thumbnail_async(
-                str(wallpaper.path), on_thumbnail_loaded
+        self._apply_selection_classes(card)
+
+        # Binds arrive one at a time; submit them together once per main loop pass
+        if self._thumbnail_requests and not self._thumbnail_flush_pending:
+            self._thumbnail_flush_pending = True
+            GLib.idle_add(self._flush_thumbnail_requests)
+
+    def _on_card_unbind(self, factory, list_item):
+        card = list_item.get_child()
+        wallpaper = card.favorite.wallpaper
+        self._cards_by_id.pop(wallpaper.id, None)
+        card.favorite = None
+
+        # Scrolled out before its thumbnail load was submitted or started
+        thumb_path = str(wallpaper.path)
+        self._thumbnail_requests = [
+            r for r in self._thumbnail_requests if r[0] != thumb_path
+        ]
+        future = self._thumbnail_futures.pop(thumb_path, None)
+        if future is not None:
+            future.cancel()
+
+    def _flush_thumbnail_requests(self):
+        self._thumbnail_flush_pending = False
+        requests, self._thumbnail_requests = self._thumbnail_requests, []
+        # A path already loading will reach whichever card is bound to it then
+        requests = [r for r in requests if r[0] not in self._thumbnail_futures]
+        if self.thumbnail_loader and requests:
+            # Duplicate paths load once
+            self._thumbnail_futures.update(
+                self.thumbnail_loader.load_thumbnails_batch(requests)
             )
+        return False
+
+    def _build_wallpaper_card(self):
+        """Build an unbound card widget; handlers act on card.favorite."""
+        # Properties and CSS classes go in at construction, one GI call per widget
+        card = Gtk.Box(
+            orientation=Gtk.Orientation.VERTICAL,
+            spacing=8,
+            hexpand=True,
+            focusable=True,
+            css_classes=["wallpaper-card"],
+        )
 
+        image = Gtk.Picture(
+            content_fit=Gtk.ContentFit.CONTAIN, css_classes=["wallpaper-thumb"]
+        )
+        image.set_size_request(200, 160)
         card.append(image)
 
         # Info box with filename and metadata
-        info_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2)
-        info_box.add_css_class("card-info-box")
-
-        # Filename
-        filename_label = Gtk.Label()
-        filename_label.set_ellipsize(Pango.EllipsizeMode.END)
-        filename_label.set_lines(1)
-        filename_label.set_max_width_chars(35)
-        filename_label.set_halign(Gtk.Align.CENTER)
-        filename_label.set_text(
-            Path(wallpaper.path).name
-            if hasattr(wallpaper, "path")
-            else wallpaper.filename
+        info_box = Gtk.Box(
+            orientation=Gtk.Orientation.VERTICAL, spacing=2, css_classes=["card-info-box"]
         )
-        filename_label.add_css_class("filename-label")
-        info_box.append(filename_label)
 
-        metadata_label = Gtk.Label()
-        metadata_parts = []
-
-        if hasattr(wallpaper, "resolution") and wallpaper.resolution:
-            metadata_parts.append(str(wallpaper.resolution))
-
-        if hasattr(wallpaper, "file_size") and wallpaper.file_size:
-            size = wallpaper.file_size
-            if size >= 1024 * 1024:
-                size_str = f"{size / (1024 * 1024):.1f} MB"
-            elif size >= 1024:
-                size_str = f"{size / 1024:.1f} KB"
-            else:
-                size_str = f"{size} B"
-            metadata_parts.append(size_str)
+        filename_label = Gtk.Label(
+            ellipsize=Pango.EllipsizeMode.END,
+            lines=1,
+            max_width_chars=35,
+            halign=Gtk.Align.CENTER,
+            css_classes=["filename-label"],
+        )
+        info_box.append(filename_label)
 
-        metadata_label.set_text(" • ".join(metadata_parts) if metadata_parts else "")
-        metadata_label.add_css_class("metadata-label")
+        metadata_label = Gtk.Label(css_classes=["metadata-label"])
         info_box.append(metadata_label)
 
         card.append(info_box)
 
         # Actions box
-        actions_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        actions_box.add_css_class("card-actions-box")
-        actions_box.set_halign(Gtk.Align.CENTER)
+        actions_box = Gtk.Box(
+            orientation=Gtk.Orientation.HORIZONTAL,
+            spacing=8,
+            halign=Gtk.Align.CENTER,
+            css_classes=["card-actions-box"],
+        )
 
         set_btn = Gtk.Button(
-            icon_name="image-x-generic-symbolic", tooltip_text="Set as wallpaper"
+            icon_name="image-x-generic-symbolic",
+            tooltip_text="Set as wallpaper",
+            css_classes=["action-button", "suggested-action"],
         )
-        set_btn.add_css_class("action-button")
-        set_btn.add_css_class("suggested-action")
         set_btn.set_cursor_from_name("pointer")
-        set_btn.connect("clicked", self._on_set_wallpaper, favorite)
+        set_btn.connect("clicked", lambda _btn: self._on_set_wallpaper(None, card.favorite))
         actions_box.append(set_btn)
 
-        remove_btn = Gtk.Button(icon_name="user-trash-symbolic", tooltip_text="Remove")
-        remove_btn.add_css_class("action-button")
-        remove_btn.add_css_class("destructive-action")
+        remove_btn = Gtk.Button(
+            icon_name="user-trash-symbolic",
+            tooltip_text="Remove",
+            css_classes=["action-button", "destructive-action"],
+        )
         remove_btn.set_cursor_from_name("pointer")
-        remove_btn.connect("clicked", self._on_remove_favorite, favorite)
+        remove_btn.connect(
+            "clicked", lambda _btn: self._on_remove_favorite(None, card.favorite)
+        )
         actions_box.append(remove_btn)
 
         card.append(actions_box)
+
+        card.favorite = None
+        card.image = image
+        card.filename_label = filename_label
+        card.metadata_label = metadata_label
         return card
 
-    def _on_card_clicked(self, gesture, n_press, x, y, favorite, card):
+    def _bind_wallpaper_card(self, card, favorite, thumbnail_requests):
+        """Point a card at a favorite.
+
+        The card's thumbnail load is appended to thumbnail_requests.
+        """
+        wallpaper = favorite.wallpaper
+        card.favorite = favorite
+
+        # Selection classes are applied by _refresh_selection_classes
+        self._cards_by_id[wallpaper.id] = card
+
+        image = card.image
+        image.set_tooltip_text(wallpaper.filename)
+        card.filename_label.set_text(wallpaper.filename)
+
+        card.metadata_label.set_text(favorite.metadata_text)
+
+        thumb_path = str(wallpaper.path)
+
+        def on_thumbnail_loaded(texture):
+            self._thumbnail_futures.pop(thumb_path, None)
+            if texture:
+                self._cache_texture(thumb_path, texture)
+                # Cards are recycled, so look up the one showing this wallpaper now
+                bound_card = self._cards_by_id.get(wallpaper.id)
+                if bound_card is not None:
+                    bound_card.image.set_paintable(texture)
+
+        texture = self._textures.get(thumb_path)
+        image.set_paintable(texture)
+        if texture:
+            self._textures.move_to_end(thumb_path)
+        else:
+            thumbnail_requests.append((thumb_path, on_thumbnail_loaded))
+
+    def _cache_texture(self, thumb_path: str, texture: Gdk.Texture) -> None:
+        self._textures[thumb_path] = texture
+        self._textures.move_to_end(thumb_path)
+        while len(self._textures) > TEXTURE_CACHE_SIZE:
+            self._textures.popitem(last=False)
+
+    def _on_grid_pressed(self, gesture, n_press, x, y):
+        widget = self.wallpapers_grid.pick(x, y, Gtk.PickFlags.DEFAULT)
+        while widget is not None and widget is not self.wallpapers_grid:
+            if getattr(widget, "favorite", None) is not None:
+                self._on_card_clicked(n_press, widget)
+                return
+            widget = widget.get_parent()
+
+    def _on_card_clicked(self, n_press, card):
+        favorite = card.favorite
         if self.view_model.selection_mode and n_press == 1:
             wallpaper = favorite.wallpaper
             self.view_model.toggle_selection(wallpaper)
-            self.update_wallpapers_grid()
+            if not self.view_model.selection_mode:
+                # Deselecting the last card ends selection mode for every card
+                self._refresh_selection_classes()
+            else:
+                # Only this card's state changed; the rest of the grid stays put
+                self._apply_selection_classes(card)
         elif n_press == 2:
 
             async def perform_set():
@@ -450,7 +560,7 @@ class FavoritesView(Adw.Bin):
 
             self._run_async(perform_set())
             if self.view_model.selection_mode:
-                self.update_wallpapers_grid()
+                self._apply_selection_classes(card)
 
     def _on_selection_toggled(self, wallpaper, is_selected):
         self.view_model.toggle_selection(wallpaper)
@@ -468,28 +578,32 @@ class FavoritesView(Adw.Bin):
         self._run_async(perform_set())
 
     def _on_remove_favorite(self, button, favorite):
-        window = self.get_root()
-
-        dialog = Adw.MessageDialog(
-            transient_for=window,
-            modal=True,
-            heading="Remove favorite?",
-            body=f"Are you sure you want to remove '{favorite.wallpaper.id}' from favorites?",
+        dialog = self._get_remove_dialog()
+        self._pending_remove_id = favorite.wallpaper_id
+        dialog.set_body(
+            f"Are you sure you want to remove '{favorite.wallpaper.id}' from favorites?"
         )
-        dialog.add_response("cancel", "Cancel")
-        dialog.add_response("remove", "Remove")
-        dialog.set_response_appearance("remove", Adw.ResponseAppearance.DESTRUCTIVE)
-        dialog.set_default_response("cancel")
-        dialog.set_close_response("cancel")
-
-        def on_response(dialog, response):
-            if response == "remove":
-
-                async def remove_favorite():
-                    await self.view_model.remove_favorite(favorite.wallpaper_id)
-
-                self._run_async(remove_favorite())
-            dialog.destroy()
-
-        dialog.connect("response", on_response)
         dialog.present()
+
+    def _get_remove_dialog(self) -> Adw.MessageDialog:
+        """Return the remove confirmation dialog, building it on first use."""
+        if self._remove_dialog is None:
+            dialog = Adw.MessageDialog(
+                transient_for=self.get_root(),
+                modal=True,
+                hide_on_close=True,
+                heading="Remove favorite?",
+            )
+            dialog.add_response("cancel", "Cancel")
+            dialog.add_response("remove", "Remove")
+            dialog.set_response_appearance("remove", Adw.ResponseAppearance.DESTRUCTIVE)
+            dialog.set_default_response("cancel")
+            dialog.set_close_response("cancel")
+            dialog.connect("response", self._on_remove_dialog_response)
+            self._remove_dialog = dialog
+        return self._remove_dialog
+
+    def _on_remove_dialog_response(self, dialog, response):
+        wallpaper_id, self._pending_remove_id = self._pending_remove_id, None
+        if response == "remove" and wallpaper_id:
+            self._run_async(self.view_model.remove_favorite(wallpaper_id))
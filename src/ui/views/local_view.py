@@ -1,30 +1,29 @@
-"""View for local wallpaper browsing with pagination support."""
+"""View for local wallpaper browsing."""
 
-import sys
+from collections import OrderedDict
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 import gi
 
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
 
-from gi.repository import Adw, Gdk, GLib, GObject, Gtk, Pango  # noqa: E402
+from gi.repository import Adw, Gdk, Gio, GLib, GObject, Gtk, Pango  # noqa: E402
 
 from core.asyncio_integration import schedule_async  # noqa: E402
+from services.local_service import LocalWallpaper  # noqa: E402
 from ui.components.search_filter_bar import SearchFilterBar  # noqa: E402
 from ui.view_models.local_view_model import LocalViewModel  # noqa: E402
 
-# Pagination settings for lazy loading
-INITIAL_PAGE_SIZE = 50
-PAGE_SIZE = 50
-LOAD_MORE_THRESHOLD = 300
-MAX_VISIBLE_ITEMS = 1000
+# Decoded thumbnails kept for cards scrolled out of view
+TEXTURE_CACHE_SIZE = 256
+
+# Length of the flash-success animation in style.css
+FLASH_DURATION_MS = 400
 
 
 class LocalView(Adw.BreakpointBin):
-    """View for local wallpaper browsing with adaptive layout and pagination"""
+    """View for local wallpaper browsing with adaptive layout"""
 
     def __init__(
         self,
@@ -45,22 +44,29 @@ class LocalView(Adw.BreakpointBin):
         self.on_delete = on_delete
         self.config_service = config_service
         self._last_selected_wallpaper = None
-        self._search_debounce_timer = None
-        self._wallpaper_card_map = {}  # Reverse mapping: wallpaper -> card
-        self._path_card_map = {}  # Mapping by path string: path -> card
-        self._upscale_overlays = {}
-        self._tag_overlays = {}
-        self._metadata_labels = {}
-        self._tags_labels = {}
+        # Pending GLib timeout ids for debounced search/sort/filter, by kind
+        self._debounce_timers: dict[str, int] = {}
+        # Cards currently bound to a wallpaper, by path string
+        self._path_card_map: dict[str, Gtk.Widget] = {}
+        # Grid position by path string, for scrolling and keyboard navigation
+        self._path_index: dict[str, int] = {}
+        # First path listed for each file name, for matching the current wallpaper
+        self._path_by_name: dict[str, str] = {}
+        # The one bound card carrying the current-wallpaper class, if any
+        self._highlighted_card: Gtk.Widget | None = None
+        # Wallpapers with an upscale or tagging job running, by path string
+        self._upscaling_paths: set[str] = set()
+        self._tagging_paths: set[str] = set()
+        # Recently shown thumbnails by path (LRU), so rebound cards don't reload them
+        self._textures: OrderedDict[str, Gdk.Texture] = OrderedDict()
+        self._thumbnail_requests: list = []
+        # Queued or running thumbnail loads by path, cancelled on unbind
+        self._thumbnail_futures: dict = {}
+        self._thumbnail_flush_pending = False
+        # One themed-icon paintable shared by every card still waiting on a thumbnail
+        self._placeholder: Gdk.Paintable | None = None
         self._needs_full_rebuild = False
-
-        # Pagination state
-        self._all_wallpapers = []  # Current view (may be filtered)
-        self._full_wallpapers = []  # Always contains all wallpapers
-        self._visible_wallpapers = []
-        self._current_page = 0
-        self._is_loading_more = False
-        self._has_more_items = True
+        self._upscaler_enabled = self._is_upscaler_enabled()
 
         self._create_ui()
 
@@ -68,7 +74,6 @@ class LocalView(Adw.BreakpointBin):
         self._bind_to_view_model()
         self._bind_upscale_signal()
         self._bind_tagging_signal()
-        self._setup_scroll_detection()
 
     def _bind_tagging_signal(self):
         """Connect to tagging signals."""
@@ -80,84 +85,6 @@ class LocalView(Adw.BreakpointBin):
         self.view_model.connect("upscaling-complete", self._on_upscale_complete)
         self.view_model.connect("upscaling-queue-changed", self._on_queue_changed)
 
-    def _setup_scroll_detection(self):
-        """Setup scroll detection for lazy loading."""
-        self._is_loading_more = False
-        self._has_more_items = True
-        vadj = self.scroll.get_vadjustment()
-        vadj.connect("value-changed", self._on_scroll_changed)
-
-    def _on_scroll_changed(self, adjustment):
-        """Handle scroll position changes for lazy loading."""
-        if self._is_loading_more or not self._has_more_items:
-            return
-        value = adjustment.get_value()
-        page_size = adjustment.get_page_size()
-        upper = adjustment.get_upper()
-        remaining = upper - (value + page_size)
-        if remaining <= LOAD_MORE_THRESHOLD:
-            self._load_more_items()
-
-    def _load_more_items(self):
-        """Load more items for lazy loading."""
-        if self._is_loading_more or not self._has_more_items:
-            return
-
-        self._is_loading_more = True
-        current_count = len(self._visible_wallpapers)
-        next_count = current_count + PAGE_SIZE
-
-        if next_count >= len(self._all_wallpapers):
-            next_count = len(self._all_wallpapers)
-            self._has_more_items = False
-
-        new_wallpapers = self._all_wallpapers[current_count:next_count]
-
-        if not new_wallpapers:
-            self._is_loading_more = False
-            return
-
-        for wallpaper in new_wallpapers:
-            card = self._create_wallpaper_card(wallpaper)
-            self.wallpaper_grid.append(card)
-
-        self._visible_wallpapers = self._all_wallpapers[:next_count]
-        self._current_page += 1
-        self._is_loading_more = False
-        self.update_status(len(self._all_wallpapers))
-
-        self._clear_old_items()
-
-    def _clear_old_items(self):
-        """Clear oldest items when exceeding max visible to manage memory."""
-        if len(self._visible_wallpapers) <= MAX_VISIBLE_ITEMS:
-            return
-
-        items_to_remove = len(self._visible_wallpapers) - MAX_VISIBLE_ITEMS
-        keep_from = items_to_remove
-
-        child = self.wallpaper_grid.get_first_child()
-        for _ in range(items_to_remove):
-            if child:
-                next_child = child.get_next_sibling()
-                self._remove_card_mappings(child)
-                self.wallpaper_grid.remove(child)
-                child = next_child
-
-        self._visible_wallpapers = self._visible_wallpapers[keep_from:]
-
-    def _remove_card_mappings(self, card):
-        """Remove all mappings for a card."""
-        if card in self.card_wallpaper_map:
-            wp = self.card_wallpaper_map.pop(card)
-            self._wallpaper_card_map.pop(wp, None)
-            self._path_card_map.pop(str(wp.path), None)
-        for path, existing_card in list(self._path_card_map.items()):
-            if existing_card == card:
-                self._path_card_map.pop(path, None)
-                self._metadata_labels.pop(path, None)
-                break
-
     def _create_ui(self):
         """Create main UI structure"""
         self.main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
@@ -188,20 +115,29 @@ class LocalView(Adw.BreakpointBin):
         self.loading_spinner = Gtk.Spinner(spinning=False)
         toolbar_wrapper.append(self.loading_spinner)
 
-    def _on_search_changed(self, text: str):
-        if self._search_debounce_timer:
-            GLib.source_remove(self._search_debounce_timer)
+    def _debounce(self, key: str, delay_ms: int, fn, *args):
+        """Run fn(*args) once key has been quiet for delay_ms."""
+        timer = self._debounce_timers.pop(key, None)
+        if timer:
+            GLib.source_remove(timer)
+
+        def fire():
+            self._debounce_timers.pop(key, None)
+            fn(*args)
+            return False
 
-        self._search_debounce_timer = GLib.timeout_add(300, self._trigger_search, text)
+        self._debounce_timers[key] = GLib.timeout_add(delay_ms, fire)
 
-    def _trigger_search(self, text: str) -> bool:
-        if self._search_debounce_timer:
-            self._search_debounce_timer = None
+    def _on_search_changed(self, text: str):
+        self._debounce("search", 300, self._trigger_search, text)
 
+    def _trigger_search(self, text: str):
         schedule_async(self.view_model.search_wallpapers(text))
-        return False
 
     def _on_sort_changed(self, sorting: str):
+        self._debounce("sort", 150, self._apply_sort, sorting)
+
+    def _apply_sort(self, sorting: str):
         self._needs_full_rebuild = True
         if sorting == "name":
             self.view_model.sort_by_name()
@@ -211,6 +147,9 @@ class LocalView(Adw.BreakpointBin):
             self.view_model.sort_by_resolution()
 
     def _on_filter_changed(self, filters: dict):
+        self._debounce("filter", 200, self._apply_filters, filters)
+
+    def _apply_filters(self, filters: dict):
         self._needs_full_rebuild = True
         self.view_model.filter_wallpapers(filters)
 
@@ -222,14 +161,27 @@ class LocalView(Adw.BreakpointBin):
         self.scroll = Gtk.ScrolledWindow()
         self.scroll.set_vexpand(True)
 
-        # Create flow box for wallpaper grid
-        self.wallpaper_grid = Gtk.FlowBox()
-        self.wallpaper_grid.set_homogeneous(True)
-        self.wallpaper_grid.set_min_children_per_line(4)
-        self.wallpaper_grid.set_max_children_per_line(12)
-        self.wallpaper_grid.set_column_spacing(12)
-        self.wallpaper_grid.set_row_spacing(12)
-        self.wallpaper_grid.set_selection_mode(Gtk.SelectionMode.NONE)
+        # The grid view only instantiates cards for visible rows and recycles
+        # them while scrolling, so large folders don't need paging
+        self._store = Gio.ListStore.new(LocalWallpaper)
+
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self._on_card_setup)
+        factory.connect("bind", self._on_card_bind)
+        factory.connect("unbind", self._on_card_unbind)
+
+        self.wallpaper_grid = Gtk.GridView(
+            model=Gtk.NoSelection(model=self._store), factory=factory
+        )
+        self.wallpaper_grid.set_min_columns(4)
+        self.wallpaper_grid.set_max_columns(12)
+        self.wallpaper_grid.add_css_class("wallpapers-grid")
+
+        # One click gesture for the whole grid; the card is found by picking
+        gesture = Gtk.GestureClick(button=1)
+        gesture.connect("pressed", self._on_grid_pressed)
+        self.wallpaper_grid.add_controller(gesture)
+
         self.scroll.set_child(self.wallpaper_grid)
 
         self.main_box.append(self.scroll)
@@ -266,14 +218,11 @@ class LocalView(Adw.BreakpointBin):
 
     def _setup_grid_navigation(self):
         """Setup keyboard navigation for wallpaper grid."""
-        # Add key controller to flow box for arrow key navigation
+        # Add key controller to the grid for arrow key navigation
         grid_key_controller = Gtk.EventControllerKey()
         grid_key_controller.connect("key-pressed", self._on_grid_key_pressed)
         self.wallpaper_grid.add_controller(grid_key_controller)
 
-        # Track card->wallpaper mapping for keyboard activation
-        self.card_wallpaper_map = {}
-
     def _on_grid_key_pressed(self, controller, keyval, keycode, state):
         """Handle keyboard navigation within grid."""
         # Arrow keys: Navigate between cards
@@ -291,17 +240,15 @@ class LocalView(Adw.BreakpointBin):
             return True
         # Enter/Return: Set wallpaper
         elif keyval in (Gdk.KEY_Return, Gdk.KEY_KP_Enter):
-            focused = self.wallpaper_grid.get_focus_child()
-            if focused and focused in self.card_wallpaper_map:
-                wallpaper = self.card_wallpaper_map[focused]
-                self._on_set_wallpaper(None, wallpaper)
+            focused = self._get_focused_card()
+            if focused and focused.wallpaper is not None:
+                self._on_set_wallpaper(None, focused.wallpaper)
             return True
         # Space: Toggle favorite
         elif keyval == Gdk.KEY_space:
-            focused = self.wallpaper_grid.get_focus_child()
-            if focused and focused in self.card_wallpaper_map:
-                wallpaper = self.card_wallpaper_map[focused]
-                self._on_add_to_favorites(None, wallpaper)
+            focused = self._get_focused_card()
+            if focused and focused.wallpaper is not None:
+                self._on_add_to_favorites(None, focused.wallpaper)
             return True
         elif keyval == Gdk.KEY_Escape:
             self.view_model.clear_selection()
@@ -312,55 +259,36 @@ class LocalView(Adw.BreakpointBin):
             return True
         return False
 
+    def _get_focused_card(self):
+        """Return the card inside the focused grid cell, if any."""
+        cell = self.wallpaper_grid.get_focus_child()
+        return cell.get_first_child() if cell else None
+
     def _focus_next_card(self):
         """Focus next card in grid."""
-        current = self.wallpaper_grid.get_focus_child()
-        if not current:
-            # Focus first card if none focused
-            first = self.wallpaper_grid.get_first_child()
-            if first:
-                first.grab_focus()
-            return
-
-        # Get all children
-        children = []
-        child = self.wallpaper_grid.get_first_child()
-        while child:
-            children.append(child)
-            child = child.get_next_sibling()
-
-        if not children:
-            return
-
-        current_idx = children.index(current)
-        next_idx = (current_idx + 1) % len(children)
-        children[next_idx].grab_focus()
+        self._focus_card_at_offset(1)
 
     def _focus_prev_card(self):
         """Focus previous card in grid."""
-        current = self.wallpaper_grid.get_focus_child()
-        if not current:
-            # Focus last card if none focused
-            last = self.wallpaper_grid.get_first_child()
-            while last and last.get_next_sibling():
-                last = last.get_next_sibling()
-            if last:
-                last.grab_focus()
-            return
-
-        # Get all children
-        children = []
-        child = self.wallpaper_grid.get_first_child()
-        while child:
-            children.append(child)
-            child = child.get_next_sibling()
+        self._focus_card_at_offset(-1)
 
-        if not children:
+    def _focus_card_at_offset(self, offset):
+        n_items = self._store.get_n_items()
+        if not n_items:
             return
 
-        current_idx = children.index(current)
-        prev_idx = (current_idx - 1) % len(children)
-        children[prev_idx].grab_focus()
+        card = self._get_focused_card()
+        index = None
+        if card is not None and card.wallpaper is not None:
+            index = self._path_index.get(card.wallpaper.path_str)
+
+        if index is None:
+            # Nothing focused yet: start from the matching end of the grid
+            target = 0 if offset > 0 else n_items - 1
+        else:
+            target = (index + offset) % n_items
+        # Scrolls the target into view first, so it works for unrealized cells too
+        self.wallpaper_grid.scroll_to(target, Gtk.ListScrollFlags.FOCUS, None)
 
     def _setup_pull_to_refresh(self):
         """Setup pull-to-refresh gesture on scrolled window."""
@@ -411,22 +339,23 @@ class LocalView(Adw.BreakpointBin):
         self._update_current_wallpaper_highlight()
 
     def _update_current_wallpaper_highlight(self):
-        """Update CSS classes to highlight the currently set wallpaper."""
+        """Move the current-wallpaper highlight to the matching bound card."""
         current_path = self.view_model.current_wallpaper_path
         if not current_path:
             return
 
-        # Remove current-wallpaper class from all cards
-        for _wallpaper, card in self._wallpaper_card_map.items():
-            card.remove_css_class("current-wallpaper")
-
-        # Add current-wallpaper class to matching card
         card = self._path_card_map.get(current_path)
-        if card:
+        if card is self._highlighted_card:
+            return
+        if self._highlighted_card is not None:
+            self._highlighted_card.remove_css_class("current-wallpaper")
+        # Unbound cards pick the class up on bind
+        self._highlighted_card = card
+        if card is not None:
             card.add_css_class("current-wallpaper")
 
     def scroll_to_current_wallpaper(self):
-        """Scroll the scrolled window to show the currently set wallpaper."""
+        """Scroll the grid to show the currently set wallpaper."""
         # Always refresh from symlink first to catch external changes
         self.view_model.refresh_current_wallpaper()
 
@@ -436,97 +365,28 @@ class LocalView(Adw.BreakpointBin):
                 self.toast_service.show_info("No current wallpaper set")
             return
 
-        target_path = current_path
-        card = self._path_card_map.get(target_path)
+        index = self._path_index.get(current_path)
 
-        if not card:
+        if index is None:
             # Try matching by filename first
-            current_filename = Path(current_path).name
-            matched_path = self._find_path_by_filename(current_filename)
+            matched_path = self._find_path_by_filename(Path(current_path).name)
             if matched_path:
-                target_path = matched_path
-                card = self._path_card_map.get(target_path)
+                index = self._path_index.get(matched_path)
 
-        if not card:
+        if index is None:
             # Try matching by content hash (handles awww cache copies)
             matched_path = self.view_model.find_wallpaper_by_hash(current_path)
             if matched_path:
-                target_path = matched_path
-                card = self._path_card_map.get(target_path)
+                index = self._path_index.get(matched_path)
 
-        if not card:
-            if not self._load_until_path_found(target_path):
-                # Try hash match after loading more
-                matched_path = self.view_model.find_wallpaper_by_hash(current_path)
-                if matched_path:
-                    target_path = matched_path
-
-        card = self._path_card_map.get(target_path)
-        if card:
-            self._scroll_to_card(card)
+        if index is not None:
+            self.wallpaper_grid.scroll_to(index, Gtk.ListScrollFlags.FOCUS, None)
         elif self.toast_service:
             self.toast_service.show_info("Current wallpaper not in list")
 
     def _find_path_by_filename(self, filename: str) -> str | None:
         """Find a wallpaper path by matching filename."""
-        for wp in self._full_wallpapers:
-            if wp.path.name == filename:
-                return str(wp.path)
-        return None
-
-    def _load_until_path_found(self, target_path: str) -> bool:
-        """Load more items until the target path is in the visible cards.
-
-        Returns True if the path was found, False otherwise.
-        """
-        target_filename = Path(target_path).name
-
-        has_match = any(str(wp.path) == target_path for wp in self._full_wallpapers)
-        has_filename_match = any(wp.path.name == target_filename for wp in self._full_wallpapers)
-
-        if not has_match and not has_filename_match:
-            return False
-
-        max_iterations = len(self._full_wallpapers) // PAGE_SIZE + 5
-        for _ in range(max_iterations):
-            if target_path in self._path_card_map:
-                return True
-            matched = self._find_path_by_filename(target_filename)
-            if matched and matched in self._path_card_map:
-                return True
-            if not self._has_more_items:
-                break
-            self._load_more_items()
-
-        return target_path in self._path_card_map or bool(
-            self._find_path_by_filename(target_filename)
-        )
-
-    def _scroll_to_card(self, card):
-        """Scroll the scrolled window to make the given card visible."""
-        vadj = self.scroll.get_vadjustment()
-
-        # Use translate_coordinates to get card position relative to scroll window
-        result = card.translate_coordinates(self.scroll, 0, 0)
-        if result is None:
-            # Fallback: try to get allocation
-            allocation = card.get_allocation()
-            card_y = allocation.y
-        else:
-            card_x, card_y = result
-
-        card_height = card.get_allocated_height()
-        scroll_height = vadj.get_page_size()
-        scroll_upper = vadj.get_upper()
-
-        # Calculate scroll position to center the card
-        new_y = card_y - (scroll_height - card_height) // 2
-
-        # Clamp to valid range
-        new_y = max(0, min(new_y, scroll_upper - scroll_height))
-
-        # Set the scroll position
-        vadj.set_value(new_y)
+        return self._path_by_name.get(filename)
 
     def _on_set_all_selected(self):
         selected = self.view_model.get_selected_wallpapers()
@@ -567,24 +427,12 @@ class LocalView(Adw.BreakpointBin):
         dialog.select_folder(window, None, on_folder_selected)
 
     def _on_wallpapers_changed(self, obj, pspec):
-        """Handle wallpapers property change with pagination."""
+        """Handle wallpapers property change."""
         wallpapers = self.view_model.wallpapers
-        self._all_wallpapers = wallpapers
-        self._full_wallpapers = wallpapers  # Keep full list for scroll-to-current
-        self._visible_wallpapers = []
-        self._current_page = 0
-        self._has_more_items = len(wallpapers) > INITIAL_PAGE_SIZE
-
-        # Clear existing grid
-        self._clear_grid()
-
-        # Load initial batch
-        initial_batch = wallpapers[:INITIAL_PAGE_SIZE]
-        for wallpaper in initial_batch:
-            card = self._create_wallpaper_card(wallpaper)
-            self.wallpaper_grid.append(card)
-
-        self._visible_wallpapers = initial_batch
+        # Read once per reload rather than on every bind
+        self._upscaler_enabled = self._is_upscaler_enabled()
+
+        self._replace_grid(wallpapers)
         self.update_status(len(wallpapers))
 
         # Refresh and highlight current wallpaper
@@ -592,41 +440,64 @@ class LocalView(Adw.BreakpointBin):
         self._update_current_wallpaper_highlight()
 
     def update_wallpaper_grid(self, wallpapers):
-        # With pagination, full rebuild handles everything
+        # The store is always rebuilt from the view model's list
         self._on_wallpapers_changed(None, None)
 
-    def _clear_grid(self):
-        """Clear all cards from the grid."""
-        child = self.wallpaper_grid.get_first_child()
-        while child:
-            next_child = child.get_next_sibling()
-            self.wallpaper_grid.remove(child)
-            self._remove_card_mappings(child)
-            child = next_child
-        self.card_wallpaper_map.clear()
-        self._wallpaper_card_map.clear()
-        self._path_card_map.clear()
-        self._metadata_labels.clear()
-        self._upscale_overlays.clear()
-
-    def _rebuild_wallpaper_grid(self, wallpapers):
-        child = self.wallpaper_grid.get_first_child()
-        while child:
-            next_child = child.get_next_sibling()
-            self.wallpaper_grid.remove(child)
-            child = next_child
-
-        self.card_wallpaper_map.clear()
-        self._wallpaper_card_map.clear()
-        self._path_card_map.clear()
-        self._metadata_labels.clear()
-        self._upscale_overlays.clear()
-
-        for wallpaper in wallpapers:
-            card = self._create_wallpaper_card(wallpaper)
-            self.wallpaper_grid.append(card)
-
-    def _create_wallpaper_card(self, wallpaper):
+    def _replace_grid(self, wallpapers):
+        """Swap the grid contents in a single items-changed emission."""
+        # Unbinding drops the card mappings and cancels their thumbnail loads
+        self._store.splice(0, self._store.get_n_items(), wallpapers)
+        self._index_wallpapers(wallpapers)
+
+    def _index_wallpapers(self, wallpapers):
+        self._path_index = {wp.path_str: i for i, wp in enumerate(wallpapers)}
+        self._path_by_name = {}
+        for wp in wallpapers:
+            self._path_by_name.setdefault(wp.filename, wp.path_str)
+
+    def _on_card_setup(self, factory, list_item):
+        list_item.set_child(self._build_wallpaper_card())
+
+    def _on_card_bind(self, factory, list_item):
+        self._bind_wallpaper_card(list_item.get_child(), list_item.get_item())
+
+        # Binds arrive one at a time; submit them together once per main loop pass
+        if self._thumbnail_requests and not self._thumbnail_flush_pending:
+            self._thumbnail_flush_pending = True
+            GLib.idle_add(self._flush_thumbnail_requests)
+
+    def _on_card_unbind(self, factory, list_item):
+        card = list_item.get_child()
+        path_str = card.wallpaper.path_str
+        self._path_card_map.pop(path_str, None)
+        card.wallpaper = None
+        if card is self._highlighted_card:
+            card.remove_css_class("current-wallpaper")
+            self._highlighted_card = None
+        # The texture stays in the LRU cache, not pinned by an offscreen card
+        self._set_card_paintable(card, None)
+
+        # Scrolled out before its thumbnail load was submitted or started
+        self._thumbnail_requests = [
+            r for r in self._thumbnail_requests if r[0] != path_str
+        ]
+        future = self._thumbnail_futures.pop(path_str, None)
+        if future is not None:
+            future.cancel()
+
+    def _flush_thumbnail_requests(self):
+        self._thumbnail_flush_pending = False
+        requests, self._thumbnail_requests = self._thumbnail_requests, []
+        # A path already loading will reach whichever card is bound to it then
+        requests = [r for r in requests if r[0] not in self._thumbnail_futures]
+        if self.thumbnail_loader and requests:
+            self._thumbnail_futures.update(
+                self.thumbnail_loader.load_thumbnails_batch(requests)
+            )
+        return False
+
+    def _build_wallpaper_card(self):
+        """Build an unbound card widget; handlers act on card.wallpaper."""
         card = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
         card.set_hexpand(True)
         card.add_css_class("wallpaper-card")
@@ -635,44 +506,14 @@ class LocalView(Adw.BreakpointBin):
         card.set_can_focus(True)
         card.set_focusable(True)
 
-        # Store mapping for keyboard activation
-        self.card_wallpaper_map[card] = wallpaper
-        self._wallpaper_card_map[wallpaper] = card
-        self._path_card_map[str(wallpaper.path)] = card
-
-        gesture = Gtk.GestureClick()
-        gesture.set_button(1)
-        gesture.connect("pressed", self._on_card_clicked, wallpaper)
-        card.add_controller(gesture)
-
-        is_selected = wallpaper in self.view_model.get_selected_wallpapers()
-        if is_selected:
-            card.add_css_class("selected")
-        if self.view_model.selection_mode:
-            card.add_css_class("selection-mode")
-
-        # Highlight current wallpaper
-        current_path = self.view_model.current_wallpaper_path
-        if current_path and str(wallpaper.path) == current_path:
-            card.add_css_class("current-wallpaper")
-
         image = Gtk.Picture()
         image.set_size_request(200, 160)
         image.set_content_fit(Gtk.ContentFit.CONTAIN)
         image.add_css_class("wallpaper-thumb")
 
-        # Create overlay container for image + spinner
+        # Create overlay container for image + job spinners
         image_overlay = Gtk.Overlay()
         image_overlay.set_child(image)
-
-        def on_thumbnail_loaded(texture):
-            if texture:
-                image.set_paintable(texture)
-
-        thumb_path = str(wallpaper.path)
-        if self.thumbnail_loader:
-            self.thumbnail_loader.load_thumbnail_async(thumb_path, on_thumbnail_loaded)
-
         card.append(image_overlay)
 
         # Info box with filename and metadata
@@ -685,51 +526,19 @@ class LocalView(Adw.BreakpointBin):
         filename_label.set_lines(1)
         filename_label.set_max_width_chars(35)
         filename_label.set_halign(Gtk.Align.CENTER)
-        filename_label.set_text(wallpaper.filename)
         filename_label.add_css_class("filename-label")
         info_box.append(filename_label)
 
-        # Metadata (resolution • size • aspect ratio)
+        # Metadata (resolution • size)
         metadata_label = Gtk.Label()
-        metadata_parts = []
-
-        if wallpaper.resolution:
-            metadata_parts.append(wallpaper.resolution)
-
-        if wallpaper.size:
-            size = wallpaper.size
-            if size >= 1024 * 1024:
-                size_str = f"{size / (1024 * 1024):.1f} MB"
-            elif size >= 1024:
-                size_str = f"{size / 1024:.1f} KB"
-            else:
-                size_str = f"{size} B"
-            metadata_parts.append(size_str)
-
-        metadata_label.set_text(" • ".join(metadata_parts) if metadata_parts else "")
         metadata_label.add_css_class("metadata-label")
         info_box.append(metadata_label)
 
         # Tags display
         tags_label = Gtk.Label()
         tags_label.add_css_class("tags-label")
-        if wallpaper.tags:
-            # Show first 5 tags, truncate if too many
-            display_tags = wallpaper.tags[:5]
-            tags_text = " ".join(f"#{tag}" for tag in display_tags)
-            if len(wallpaper.tags) > 5:
-                tags_text += f" +{len(wallpaper.tags) - 5}"
-            tags_label.set_text(tags_text)
-            tags_label.set_tooltip_text(" • ".join(wallpaper.tags))
-        else:
-            tags_label.set_text("No tags")
-            tags_label.add_css_class("dim-label")
         info_box.append(tags_label)
 
-        path_str = str(wallpaper.path)
-        self._metadata_labels[path_str] = metadata_label
-        self._tags_labels[path_str] = tags_label
-
         card.append(info_box)
 
         # Actions box
@@ -741,41 +550,141 @@ class LocalView(Adw.BreakpointBin):
         set_btn.add_css_class("action-button")
         set_btn.add_css_class("suggested-action")
         set_btn.set_cursor_from_name("pointer")
-        set_btn.connect("clicked", self._on_set_wallpaper, wallpaper)
+        set_btn.connect("clicked", lambda _btn: self._on_set_wallpaper(None, card.wallpaper))
         actions_box.append(set_btn)
 
         fav_btn = Gtk.Button(icon_name="starred-symbolic", tooltip_text="Add to favorites")
         fav_btn.add_css_class("action-button")
         fav_btn.add_css_class("favorite-action")
         fav_btn.set_cursor_from_name("pointer")
-        fav_btn.connect("clicked", self._on_add_to_favorites, wallpaper)
+        fav_btn.connect("clicked", lambda _btn: self._on_add_to_favorites(None, card.wallpaper))
         actions_box.append(fav_btn)
 
         delete_btn = Gtk.Button(icon_name="user-trash-symbolic", tooltip_text="Delete")
         delete_btn.add_css_class("action-button")
         delete_btn.add_css_class("destructive-action")
         delete_btn.set_cursor_from_name("pointer")
-        delete_btn.connect("clicked", self._on_delete_wallpaper, wallpaper)
+        delete_btn.connect(
+            "clicked", lambda _btn: self._on_delete_wallpaper(None, card.wallpaper)
+        )
         actions_box.append(delete_btn)
 
-        # Show upscale button only if enabled in config
-        if self._is_upscaler_enabled():
-            upscale_btn = Gtk.Button(icon_name="zoom-in-symbolic", tooltip_text="Upscale 2x (AI)")
-            upscale_btn.add_css_class("action-button")
-            upscale_btn.set_cursor_from_name("pointer")
-            upscale_btn.connect("clicked", self._on_upscale_wallpaper, wallpaper)
-            actions_box.append(upscale_btn)
+        # Shown on bind only if enabled in config
+        upscale_btn = Gtk.Button(icon_name="zoom-in-symbolic", tooltip_text="Upscale 2x (AI)")
+        upscale_btn.add_css_class("action-button")
+        upscale_btn.set_cursor_from_name("pointer")
+        upscale_btn.connect(
+            "clicked", lambda _btn: self._on_upscale_wallpaper(None, card.wallpaper)
+        )
+        actions_box.append(upscale_btn)
 
         # Show tag button
         tag_btn = Gtk.Button(icon_name="tag-symbolic", tooltip_text="Generate AI tags")
         tag_btn.add_css_class("action-button")
         tag_btn.set_cursor_from_name("pointer")
-        tag_btn.connect("clicked", self._on_generate_tags, wallpaper)
+        tag_btn.connect("clicked", lambda _btn: self._on_generate_tags(None, card.wallpaper))
         actions_box.append(tag_btn)
 
         card.append(actions_box)
+
+        card.wallpaper = None
+        card.image = image
+        card.image_overlay = image_overlay
+        card.upscale_overlay = None
+        card.tag_overlay = None
+        card.metadata_label = metadata_label
+        card.filename_label = filename_label
+        card.tags_label = tags_label
+        card.upscale_btn = upscale_btn
         return card
 
+    def _bind_wallpaper_card(self, card, wallpaper):
+        """Point a recycled card at a wallpaper."""
+        path_str = wallpaper.path_str
+        card.wallpaper = wallpaper
+        self._path_card_map[path_str] = card
+
+        if self.view_model.is_selected(wallpaper):
+            card.add_css_class("selected")
+        else:
+            card.remove_css_class("selected")
+        if self.view_model.selection_mode:
+            card.add_css_class("selection-mode")
+        else:
+            card.remove_css_class("selection-mode")
+
+        # Highlight current wallpaper
+        if path_str == self.view_model.current_wallpaper_path:
+            card.add_css_class("current-wallpaper")
+            self._highlighted_card = card
+
+        card.filename_label.set_text(wallpaper.filename)
+        card.metadata_label.set_text(wallpaper.metadata_text)
+        self._set_tags_label(card.tags_label, wallpaper)
+        card.upscale_btn.set_visible(self._upscaler_enabled)
+
+        # Job spinners follow the wallpaper, not the recycled card
+        if path_str in self._upscaling_paths:
+            self._show_upscale_overlay(card)
+        else:
+            self._hide_upscale_overlay(card)
+        if path_str in self._tagging_paths:
+            self._show_tag_overlay(card)
+        else:
+            self._hide_tag_overlay(card)
+
+        texture = self._textures.get(path_str)
+        self._set_card_paintable(card, texture)
+        if texture:
+            self._textures.move_to_end(path_str)
+        else:
+            self._thumbnail_requests.append(
+                (path_str, lambda texture: self._on_thumbnail_loaded(path_str, texture))
+            )
+
+    def _on_thumbnail_loaded(self, path_str, texture):
+        self._thumbnail_futures.pop(path_str, None)
+        if not texture:
+            return
+        self._cache_texture(path_str, texture)
+        # Cards are recycled, so look up the one showing this wallpaper now
+        card = self._path_card_map.get(path_str)
+        if card is not None:
+            self._set_card_paintable(card, texture)
+
+    def _set_card_paintable(self, card, texture):
+        """Show the thumbnail, or the shared placeholder icon while it loads."""
+        if texture:
+            card.image.set_content_fit(Gtk.ContentFit.CONTAIN)
+            card.image.set_paintable(texture)
+            return
+        if self._placeholder is None:
+            icon_theme = Gtk.IconTheme.get_for_display(Gdk.Display.get_default())
+            self._placeholder = icon_theme.lookup_icon(
+                "image-x-generic-symbolic", None, 48, 1, Gtk.TextDirection.NONE, 0
+            )
+        # Keep the icon at its own size instead of stretching it over the card
+        card.image.set_content_fit(Gtk.ContentFit.SCALE_DOWN)
+        card.image.set_paintable(self._placeholder)
+
+    def _cache_texture(self, path_str: str, texture: Gdk.Texture) -> None:
+        self._textures[path_str] = texture
+        self._textures.move_to_end(path_str)
+        while len(self._textures) > TEXTURE_CACHE_SIZE:
+            self._textures.popitem(last=False)
+
+    @staticmethod
+    def _set_tags_label(tags_label, wallpaper):
+        tags_text = wallpaper.tags_display
+        if tags_text:
+            tags_label.set_text(tags_text)
+            tags_label.set_tooltip_text(wallpaper.tags_tooltip)
+            tags_label.remove_css_class("dim-label")
+        else:
+            tags_label.set_text("No tags")
+            tags_label.set_tooltip_text(None)
+            tags_label.add_css_class("dim-label")
+
     def _is_upscaler_enabled(self) -> bool:
         """Returns True if upscaler is enabled in config."""
         if not self.config_service:
@@ -783,9 +692,17 @@ class LocalView(Adw.BreakpointBin):
         config = self.config_service.get_config()
         return config.upscaler_enabled if config else False
 
-    def _on_card_clicked(self, gesture, n_press, x, y, wallpaper):
+    def _on_grid_pressed(self, gesture, n_press, x, y):
+        widget = self.wallpaper_grid.pick(x, y, Gtk.PickFlags.DEFAULT)
+        while widget is not None and widget is not self.wallpaper_grid:
+            if getattr(widget, "wallpaper", None) is not None:
+                self._on_card_clicked(n_press, widget)
+                return
+            widget = widget.get_parent()
+
+    def _on_card_clicked(self, n_press, card):
         if n_press == 2:
-            self._on_set_wallpaper(None, wallpaper)
+            self._on_set_wallpaper(None, card.wallpaper)
 
     def _on_selection_toggled(self, wallpaper, is_selected):
         self.view_model.toggle_selection(wallpaper)
@@ -849,7 +766,9 @@ class LocalView(Adw.BreakpointBin):
     def _on_upscale_wallpaper(self, button, wallpaper):
         success, message = self.view_model.queue_upscale(wallpaper)
         if success:
-            card = self._wallpaper_card_map.get(wallpaper)
+            path_str = wallpaper.path_str
+            self._upscaling_paths.add(path_str)
+            card = self._path_card_map.get(path_str)
             if card:
                 self._show_upscale_overlay(card)
             if self.toast_service:
@@ -861,7 +780,9 @@ class LocalView(Adw.BreakpointBin):
     def _on_generate_tags(self, button, wallpaper):
         success, message = self.view_model.queue_generate_tags(wallpaper)
         if success:
-            card = self._wallpaper_card_map.get(wallpaper)
+            path_str = wallpaper.path_str
+            self._tagging_paths.add(path_str)
+            card = self._path_card_map.get(path_str)
             if card:
                 self._show_tag_overlay(card)
             if self.toast_service:
@@ -872,20 +793,17 @@ class LocalView(Adw.BreakpointBin):
 
     def _show_tag_overlay(self, card):
         """Show blocking overlay with spinner on the card's image."""
-        if card in self._tag_overlays:
-            return
-
-        image_overlay = None
-        child = card.get_first_child()
-        while child:
-            if isinstance(child, Gtk.Overlay):
-                image_overlay = child
-                break
-            child = child.get_next_sibling()
+        if card.tag_overlay is None:
+            card.tag_overlay = self._add_spinner_overlay(card)
 
-        if not image_overlay:
-            return
+    def _hide_tag_overlay(self, card):
+        """Hide blocking overlay from the card."""
+        if card.tag_overlay is not None:
+            card.image_overlay.remove_overlay(card.tag_overlay)
+            card.tag_overlay = None
 
+    @staticmethod
+    def _add_spinner_overlay(card):
         overlay = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
         overlay.add_css_class("upscale-overlay-small")
         overlay.set_halign(Gtk.Align.CENTER)
@@ -895,49 +813,25 @@ class LocalView(Adw.BreakpointBin):
         spinner.set_size_request(24, 24)
         overlay.append(spinner)
 
-        image_overlay.add_overlay(overlay)
-        self._tag_overlays[card] = overlay
-
-    def _hide_tag_overlay(self, card):
-        """Hide blocking overlay from the card."""
-        if card not in self._tag_overlays:
-            return
-
-        overlay = self._tag_overlays.pop(card)
-
-        image_overlay = None
-        child = card.get_first_child()
-        while child:
-            if isinstance(child, Gtk.Overlay):
-                image_overlay = child
-                break
-            child = child.get_next_sibling()
-
-        if image_overlay:
-            image_overlay.remove_overlay(overlay)
+        # Stacked on top of the image, no layout impact
+        card.image_overlay.add_overlay(overlay)
+        return overlay
 
     def _on_tagging_complete(self, view_model, success: bool, message: str, wallpaper_path: str):
         """Handle tagging completion."""
+        self._tagging_paths.discard(wallpaper_path)
+        card = self._path_card_map.get(wallpaper_path)
+        if card:
+            self._hide_tag_overlay(card)
+
         if success:
             if self.toast_service:
                 self.toast_service.show_success(message)
-            card = self._path_card_map.get(wallpaper_path)
             if card:
-                self._hide_tag_overlay(card)
                 self._refresh_wallpaper_card_by_path(wallpaper_path)
-            else:
-                for wp in self.view_model.wallpapers:
-                    if wp in self._wallpaper_card_map:
-                        card = self._wallpaper_card_map[wp]
-                        self._hide_tag_overlay(card)
-                        self._refresh_wallpaper_card(wp)
-                        break
         else:
             if self.toast_service:
                 self.toast_service.show_error(message)
-            card = self._path_card_map.get(wallpaper_path)
-            if card:
-                self._hide_tag_overlay(card)
 
     def _on_tagging_queue_changed(self, view_model, queue_size: int, active_count: int):
         """Handle tagging queue changes."""
@@ -947,83 +841,33 @@ class LocalView(Adw.BreakpointBin):
 
     def _show_upscale_overlay(self, card):
         """Show blocking overlay with spinner on the card's image."""
-        if card in self._upscale_overlays:
-            return
-
-        # Find the image_overlay in the card
-        image_overlay = None
-        child = card.get_first_child()
-        while child:
-            if isinstance(child, Gtk.Overlay):
-                image_overlay = child
-                break
-            child = child.get_next_sibling()
-
-        if not image_overlay:
-            return
-
-        # Create overlay widget
-        overlay = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-        overlay.add_css_class("upscale-overlay-small")
-        overlay.set_halign(Gtk.Align.CENTER)
-        overlay.set_valign(Gtk.Align.CENTER)
-
-        # Spinner
-        spinner = Gtk.Spinner(spinning=True)
-        spinner.set_size_request(24, 24)
-        overlay.append(spinner)
-
-        # Add to image overlay (stacked on top, no layout impact)
-        image_overlay.add_overlay(overlay)
-        self._upscale_overlays[card] = overlay
+        if card.upscale_overlay is None:
+            card.upscale_overlay = self._add_spinner_overlay(card)
 
     def _hide_upscale_overlay(self, card):
         """Hide blocking overlay from the card."""
-        if card not in self._upscale_overlays:
-            return
-
-        overlay = self._upscale_overlays.pop(card)
-
-        # Find the image_overlay
-        image_overlay = None
-        child = card.get_first_child()
-        while child:
-            if isinstance(child, Gtk.Overlay):
-                image_overlay = child
-                break
-            child = child.get_next_sibling()
-
-        if image_overlay:
-            image_overlay.remove_overlay(overlay)
+        if card.upscale_overlay is not None:
+            card.image_overlay.remove_overlay(card.upscale_overlay)
+            card.upscale_overlay = None
 
     def _on_upscale_complete(self, view_model, success: bool, message: str, wallpaper_path: str):
         """Handle upscaling completion."""
+        self._upscaling_paths.discard(wallpaper_path)
+        # Hide overlay even on failure
+        card = self._path_card_map.get(wallpaper_path)
+        if card:
+            self._hide_upscale_overlay(card)
+
         if success:
             if self.toast_service:
                 self.toast_service.show_success(message)
-            # Find and refresh the card by path
-            card = self._path_card_map.get(wallpaper_path)
+            # The file was replaced in place, so its path-keyed thumbnails are stale
+            self._reload_thumbnail(wallpaper_path)
             if card:
-                self._hide_upscale_overlay(card)
                 self._refresh_wallpaper_card_by_path(wallpaper_path)
-            else:
-                # Fallback: search in wallpaper map
-                for wp in self.view_model.wallpapers:
-                    if wp in self._wallpaper_card_map:
-                        card = self._wallpaper_card_map[wp]
-                        self._hide_upscale_overlay(card)
-                        self._refresh_wallpaper_card(wp)
-                        break
         else:
             if self.toast_service:
                 self.toast_service.show_error(message)
-            # Hide overlay even on failure
-            for wp in self.view_model.wallpapers:
-                if wp in self._wallpaper_card_map:
-                    card = self._wallpaper_card_map[wp]
-                    if card in self._upscale_overlays:
-                        self._hide_upscale_overlay(card)
-                    break
 
     def _on_queue_changed(self, view_model, queue_size: int, active_count: int):
         """Handle queue status changes."""
@@ -1039,30 +883,22 @@ class LocalView(Adw.BreakpointBin):
                 else:
                     self.toast_service.show_info(f"Upscaling {active_count} item(s)...")
 
-    def _refresh_wallpaper_card(self, wallpaper):
-        """Refresh a single wallpaper card with visual flash effect."""
-        card = self._wallpaper_card_map.get(wallpaper)
-        if not card:
+    def _reload_thumbnail(self, path_str: str):
+        """Drop every cached thumbnail of a rewritten file and reload its card."""
+        self._textures.pop(path_str, None)
+        if not self.thumbnail_loader:
             return
+        self.thumbnail_loader.invalidate_local(path_str)
 
-        # Get the image widget (first child after any overlays)
-        image = card.get_first_child()
-        if not image:
+        if path_str not in self._path_card_map:
+            # The next bind queues a fresh load
             return
-
-        # Load new thumbnail
-        def on_thumbnail_loaded(texture):
-            if texture:
-                image.set_paintable(texture)
-
-        if self.thumbnail_loader:
-            self.thumbnail_loader.load_thumbnail_async(str(wallpaper.path), on_thumbnail_loaded)
-
-        # Add flash effect
-        card.add_css_class("flash-animation")
-        GLib.timeout_add(100, lambda: card.remove_css_class("flash-animation"))
-        GLib.timeout_add(200, lambda: card.add_css_class("flash-animation"))
-        GLib.timeout_add(300, lambda: card.remove_css_class("flash-animation"))
+        previous = self._thumbnail_futures.pop(path_str, None)
+        if previous is not None:
+            previous.cancel()
+        self._thumbnail_futures[path_str] = self.thumbnail_loader.load_thumbnail_async(
+            path_str, lambda texture: self._on_thumbnail_loaded(path_str, texture)
+        )
 
     def _refresh_wallpaper_card_by_path(self, path: str):
         """Refresh a wallpaper card by path string."""
@@ -1070,64 +906,19 @@ class LocalView(Adw.BreakpointBin):
         if not card:
             return
 
-        wallpaper = None
-        for wp in self.view_model.wallpapers:
-            if str(wp.path) == path:
-                wallpaper = wp
-                break
+        wallpaper = card.wallpaper
+        # The view model updates size, resolution and tags before signalling
+        card.metadata_label.set_text(wallpaper.metadata_text)
+        self._set_tags_label(card.tags_label, wallpaper)
 
-        metadata_label = self._metadata_labels.get(path)
-        if metadata_label:
-            try:
-                import os
-
-                from PIL import Image
-
-                file_path = path
-                file_stat = os.stat(file_path)
-
-                resolution_text = ""
-                try:
-                    with Image.open(file_path) as img:
-                        width, height = img.size
-                        resolution_text = f"{width}x{height}"
-                except Exception:
-                    pass
-
-                size = file_stat.st_size
-                if size >= 1024 * 1024:
-                    size_str = f"{size / (1024 * 1024):.1f} MB"
-                elif size >= 1024:
-                    size_str = f"{size / 1024:.1f} KB"
-                else:
-                    size_str = f"{size} B"
-
-                parts = []
-                if resolution_text:
-                    parts.append(resolution_text)
-                parts.append(size_str)
-                metadata_label.set_text(" • ".join(parts) if parts else "")
-            except Exception:
-                pass
-
-        tags_label = self._tags_labels.get(path)
-        if tags_label and wallpaper:
-            if wallpaper.tags:
-                display_tags = wallpaper.tags[:5]
-                tags_text = " ".join(f"#{tag}" for tag in display_tags)
-                if len(wallpaper.tags) > 5:
-                    tags_text += f" +{len(wallpaper.tags) - 5}"
-                tags_label.set_text(tags_text)
-                tags_label.set_tooltip_text(" • ".join(wallpaper.tags))
-                tags_label.remove_css_class("dim-label")
-            else:
-                tags_label.set_text("No tags")
-                tags_label.add_css_class("dim-label")
+        self._flash_card(card)
 
+    @staticmethod
+    def _flash_card(card):
+        """Pulse the card; the CSS keyframes run both pulses on their own."""
         card.add_css_class("flash-animation")
-        GLib.timeout_add(100, lambda: card.remove_css_class("flash-animation"))
-        GLib.timeout_add(200, lambda: card.add_css_class("flash-animation"))
-        GLib.timeout_add(300, lambda: card.remove_css_class("flash-animation"))
+        # Two 200ms iterations of flash-success, then drop the class
+        GLib.timeout_add(FLASH_DURATION_MS, lambda: card.remove_css_class("flash-animation"))
 
     def _reset_refresh_flag(self):
         """Reset refreshing flag."""
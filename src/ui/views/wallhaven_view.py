@@ -1,10 +1,6 @@
 """View for Wallhaven wallpaper browsing."""
 
 import logging
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 import gi
 
@@ -14,6 +10,7 @@ gi.require_version("Adw", "1")
 from gi.repository import Adw, Gdk, GLib, Gtk  # noqa: E402
 
 from core.asyncio_integration import schedule_async  # noqa: E402
+from domain.wallpaper import format_metadata  # noqa: E402
 from ui.components.search_filter_bar import SearchFilterBar  # noqa: E402
 from ui.view_models.wallhaven_view_model import WallhavenViewModel  # noqa: E402
 
@@ -37,6 +34,11 @@ class WallhavenView(Adw.Bin):
         self.thumbnail_loader = thumbnail_loader
         self._last_selected_wallpaper = None
         self._search_debounce_timer = None
+        # Thumbnail loads for the current page, cancelled when it is replaced
+        self._thumbnail_futures = []
+        # Every card built so far, in grid order; the first _bound_count show wallpapers
+        self._card_pool: list[Gtk.Box] = []
+        self._bound_count = 0
 
         self._create_ui()
 
@@ -167,6 +169,7 @@ class WallhavenView(Adw.Bin):
 
     def _bind_to_view_model(self):
         self.view_model.connect("notify::wallpapers", self._on_wallpapers_changed)
+        self.view_model.connect("items-added", self._on_wallpapers_added)
         self.view_model.connect("notify::current-page", self._on_page_changed)
         self.view_model.connect("notify::total-pages", self._on_page_changed)
         self.view_model.connect("notify::total-wallpapers", self._on_page_changed)
@@ -235,50 +238,42 @@ class WallhavenView(Adw.Bin):
             return True
         return False
 
-    def _focus_next_card(self):
-        """Focus next card in grid."""
-        current = self.wallpaper_grid.get_focus_child()
-        if not current:
-            # Focus first card if none focused
-            first = self.wallpaper_grid.get_first_child()
-            if first:
-                first.grab_focus()
-            return
-
-        # Get all children
+    def _visible_cards(self):
+        """FlowBox children in order, skipping pooled cards parked off the grid."""
         children = []
         child = self.wallpaper_grid.get_first_child()
         while child:
-            children.append(child)
+            if child.get_visible():
+                children.append(child)
             child = child.get_next_sibling()
+        return children
 
+    def _focus_next_card(self):
+        """Focus next card in grid."""
+        children = self._visible_cards()
         if not children:
             return
 
+        current = self.wallpaper_grid.get_focus_child()
+        if current not in children:
+            # Focus first card if none focused
+            children[0].grab_focus()
+            return
+
         current_idx = children.index(current)
         next_idx = (current_idx + 1) % len(children)
         children[next_idx].grab_focus()
 
     def _focus_prev_card(self):
         """Focus previous card in grid."""
-        current = self.wallpaper_grid.get_focus_child()
-        if not current:
-            # Focus last card if none focused
-            last = self.wallpaper_grid.get_first_child()
-            while last and last.get_next_sibling():
-                last = last.get_next_sibling()
-            if last:
-                last.grab_focus()
+        children = self._visible_cards()
+        if not children:
             return
 
-        # Get all children
-        children = []
-        child = self.wallpaper_grid.get_first_child()
-        while child:
-            children.append(child)
-            child = child.get_next_sibling()
-
-        if not children:
+        current = self.wallpaper_grid.get_focus_child()
+        if current not in children:
+            # Focus last card if none focused
+            children[-1].grab_focus()
             return
 
         current_idx = children.index(current)
@@ -396,6 +391,15 @@ class WallhavenView(Adw.Bin):
     def _on_wallpapers_changed(self, obj, pspec):
         self.update_wallpaper_grid(self.view_model.wallpapers)
 
+    def _on_wallpapers_added(self, obj, position, wallpapers):
+        thumb_urls = self.view_model.thumbnail_urls[position : position + len(wallpapers)]
+
+        def append_cards():
+            self._bind_cards(self._bound_count, wallpapers, thumb_urls)
+            return False
+
+        GLib.idle_add(append_cards)
+
     def _on_page_changed(self, obj, pspec):
         """Handle page property change"""
         self.update_pagination(
@@ -411,43 +415,55 @@ class WallhavenView(Adw.Bin):
 
     def update_wallpaper_grid(self, wallpapers):
         """Update wallpaper grid with new wallpapers"""
+        if wallpapers is self.view_model.wallpapers:
+            thumb_urls = self.view_model.thumbnail_urls
+        else:
+            thumb_urls = [w.thumbs_large or w.thumbs_small for w in wallpapers]
 
-        def clear_and_update():
-            while child := self.wallpaper_grid.get_first_child():
-                self.wallpaper_grid.remove(child)
+        def rebind_cards():
+            self._cancel_thumbnail_loads()
+            self._bind_cards(0, wallpapers, thumb_urls)
 
-            for wallpaper in wallpapers:
-                card = self._create_wallpaper_card(wallpaper)
-                self.wallpaper_grid.append(card)
+            # Park the leftover cards for the next page instead of destroying them
+            for card in self._card_pool[len(wallpapers) : self._bound_count]:
+                self._unbind_wallpaper_card(card)
+            self._bound_count = len(wallpapers)
 
             return False
 
-        GLib.idle_add(clear_and_update)
+        GLib.idle_add(rebind_cards)
+
+    def _bind_cards(self, start, wallpapers, thumb_urls):
+        """Show wallpapers from grid position start, building cards only past the pool."""
+        pairs = zip(wallpapers, thumb_urls, strict=True)
+        for index, (wallpaper, thumb_url) in enumerate(pairs, start):
+            if index < len(self._card_pool):
+                card = self._card_pool[index]
+            else:
+                card = self._build_wallpaper_card()
+                self._card_pool.append(card)
+                self.wallpaper_grid.append(card)
+            self._bind_wallpaper_card(card, wallpaper, thumb_url)
+        self._bound_count = max(self._bound_count, start + len(wallpapers))
+
+    def _cancel_thumbnail_loads(self):
+        """Drop queued thumbnail loads for cards that are about to go away."""
+        for future in self._thumbnail_futures:
+            future.cancel()
+        self._thumbnail_futures.clear()
 
-    def _create_wallpaper_card(self, wallpaper):
+    def _build_wallpaper_card(self):
+        """Build an empty card; handlers read card.wallpaper so rebinding needs no reconnects."""
         card = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
         card.set_hexpand(True)
         card.add_css_class("wallpaper-card")
-
-        is_selected = wallpaper in self.view_model.get_selected_wallpapers()
-        if is_selected:
-            card.add_css_class("selected")
-        if self.view_model.selection_mode:
-            card.add_css_class("selection-mode")
+        card.wallpaper = None
 
         image = Gtk.Picture()
         image.set_size_request(200, 160)
         image.set_content_fit(Gtk.ContentFit.COVER)
         image.add_css_class("wallpaper-thumb")
 
-        def on_thumbnail_loaded(texture):
-            if texture:
-                image.set_paintable(texture)
-
-        thumb_url = wallpaper.thumbs_large or wallpaper.thumbs_small or ""
-        if thumb_url and self.thumbnail_loader:
-            self.thumbnail_loader.load_thumbnail_async(thumb_url, on_thumbnail_loaded)
-
         overlay = Gtk.Overlay()
         overlay.set_child(image)
 
@@ -457,13 +473,8 @@ class WallhavenView(Adw.Bin):
         checkbox.set_valign(Gtk.Align.START)
         checkbox.set_margin_start(8)
         checkbox.set_margin_top(8)
-        checkbox.set_active(is_selected)
-        if self.view_model.selection_mode:
-            checkbox.set_visible(True)
-        else:
-            checkbox.set_visible(False)
         checkbox.connect(
-            "toggled", lambda cb: self._on_selection_toggled(wallpaper, cb.get_active())
+            "toggled", lambda cb: self._on_selection_toggled(card.wallpaper, cb.get_active())
         )
         overlay.add_overlay(checkbox)
 
@@ -473,22 +484,6 @@ class WallhavenView(Adw.Bin):
         info_box.add_css_class("card-info-box")
 
         metadata_label = Gtk.Label()
-        metadata_parts = []
-
-        if hasattr(wallpaper, "resolution") and wallpaper.resolution:
-            metadata_parts.append(str(wallpaper.resolution))
-
-        if hasattr(wallpaper, "file_size") and wallpaper.file_size:
-            size = wallpaper.file_size
-            if size >= 1024 * 1024:
-                size_str = f"{size / (1024 * 1024):.1f} MB"
-            elif size >= 1024:
-                size_str = f"{size / 1024:.1f} KB"
-            else:
-                size_str = f"{size} B"
-            metadata_parts.append(size_str)
-
-        metadata_label.set_text(" • ".join(metadata_parts) if metadata_parts else "")
         metadata_label.add_css_class("caption")
         info_box.append(metadata_label)
 
@@ -496,7 +491,7 @@ class WallhavenView(Adw.Bin):
 
         click = Gtk.GestureClick()
         click.set_button(1)
-        click.connect("pressed", self._on_card_clicked, wallpaper, card, checkbox)
+        click.connect("pressed", self._on_card_clicked, card)
         card.add_controller(click)
 
         actions_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
@@ -509,7 +504,9 @@ class WallhavenView(Adw.Bin):
         download_btn.add_css_class("action-button")
         download_btn.add_css_class("download-action")
         download_btn.set_cursor_from_name("pointer")
-        download_btn.connect("clicked", self._on_download_wallpaper, wallpaper)
+        download_btn.connect(
+            "clicked", lambda btn: self._on_download_wallpaper(btn, card.wallpaper)
+        )
         actions_box.append(download_btn)
 
         set_btn = Gtk.Button(
@@ -518,7 +515,7 @@ class WallhavenView(Adw.Bin):
         set_btn.add_css_class("action-button")
         set_btn.add_css_class("suggested-action")
         set_btn.set_cursor_from_name("pointer")
-        set_btn.connect("clicked", self._on_set_wallpaper, wallpaper)
+        set_btn.connect("clicked", lambda btn: self._on_set_wallpaper(btn, card.wallpaper))
         actions_box.append(set_btn)
 
         fav_btn = Gtk.Button(
@@ -527,22 +524,67 @@ class WallhavenView(Adw.Bin):
         fav_btn.add_css_class("action-button")
         fav_btn.add_css_class("favorite-action")
         fav_btn.set_cursor_from_name("pointer")
-        fav_btn.connect("clicked", self._on_add_to_favorites, wallpaper)
+        fav_btn.connect("clicked", lambda btn: self._on_add_to_favorites(btn, card.wallpaper))
         actions_box.append(fav_btn)
 
         card.append(actions_box)
+
+        card.image = image
+        card.checkbox = checkbox
+        card.metadata_label = metadata_label
         return card
 
-    def _on_card_clicked(self, gesture, n_press, x, y, wallpaper, card, checkbox):
+    def _bind_wallpaper_card(self, card, wallpaper, thumb_url: str):
+        """Point a pooled card at a wallpaper and start its thumbnail load."""
+        card.wallpaper = wallpaper
+        card.get_parent().set_visible(True)
+
+        is_selected = self.view_model.is_selected(wallpaper)
+        if is_selected:
+            card.add_css_class("selected")
+        else:
+            card.remove_css_class("selected")
+        if self.view_model.selection_mode:
+            card.add_css_class("selection-mode")
+        else:
+            card.remove_css_class("selection-mode")
+
+        # Already matches the selection, so the toggled handler leaves it alone
+        card.checkbox.set_active(is_selected)
+        card.checkbox.set_visible(self.view_model.selection_mode)
+
+        card.metadata_label.set_text(format_metadata(wallpaper.resolution, wallpaper.file_size))
+
+        card.image.set_paintable(None)
+
+        def on_thumbnail_loaded(texture):
+            # The card may have been rebound to another wallpaper meanwhile
+            if texture and card.wallpaper is wallpaper:
+                card.image.set_paintable(texture)
+
+        if thumb_url and self.thumbnail_loader:
+            self._thumbnail_futures.append(
+                self.thumbnail_loader.load_thumbnail_async(thumb_url, on_thumbnail_loaded)
+            )
+
+    @staticmethod
+    def _unbind_wallpaper_card(card):
+        card.wallpaper = None
+        card.image.set_paintable(None)
+        card.get_parent().set_visible(False)
+
+    def _on_card_clicked(self, gesture, n_press, x, y, card):
+        checkbox = card.checkbox
         if self.view_model.selection_mode and n_press == 1:
             checkbox.set_active(not checkbox.get_active())
         elif n_press == 2:
-            self._on_set_wallpaper(None, wallpaper)
+            self._on_set_wallpaper(None, card.wallpaper)
             if self.view_model.selection_mode:
                 checkbox.set_active(not checkbox.get_active())
 
     def _on_selection_toggled(self, wallpaper, is_selected):
-        self.view_model.toggle_selection(wallpaper)
+        if wallpaper is not None and is_selected != self.view_model.is_selected(wallpaper):
+            self.view_model.toggle_selection(wallpaper)
 
     def _on_set_wallpaper(self, button, wallpaper):
         async def set_wallpaper_with_download():
@@ -112,3 +112,22 @@ def test_favorite_from_dict_with_wallpaper_class():
     assert favorite.wallpaper_id == "fav1"
     assert favorite.wallpaper.category == "anime"
     assert favorite.wallpaper.source == WallpaperSource.WALLHAVEN
+
+
+def test_favorite_metadata_text():
+    """Test metadata_text formats resolution and file size."""
+    wallpaper = Wallpaper(
+        id="meta1",
+        url="http://example.com/view/1",
+        path="http://example.com/full.jpg",
+        resolution=Resolution(width=2560, height=1440),
+        source=WallpaperSource.WALLHAVEN,
+        category="anime",
+        purity=WallpaperPurity.SFW,
+        file_size=3 * 1024 * 1024,
+    )
+    favorite = Favorite(wallpaper=wallpaper, added_at=datetime.now())
+
+    assert favorite.metadata_text == "2560x1440 • 3.0 MB"
+    # Formatted once and reused on rebinds
+    assert favorite.metadata_text is favorite.metadata_text
@@ -2,7 +2,13 @@
 
 import pytest
 
-from domain.wallpaper import Resolution, Wallpaper, WallpaperPurity, WallpaperSource
+from domain.wallpaper import (
+    Resolution,
+    Wallpaper,
+    WallpaperPurity,
+    WallpaperSource,
+    format_metadata,
+)
 
 
 def test_resolution_value_object():
@@ -116,3 +122,50 @@ def test_wallpaper_from_dict_defaults():
     assert wallpaper.colors == []
     assert wallpaper.file_size == 0
     assert wallpaper.thumbs_large == ""
+
+
+def test_wallpaper_filename_and_extension():
+    """Test filename and extension are parsed from path, with a jpg fallback."""
+    res = Resolution(width=1920, height=1080)
+
+    def make(path: str) -> Wallpaper:
+        return Wallpaper(
+            id="test1",
+            url="http://example.com/view/1",
+            path=path,
+            resolution=res,
+            source=WallpaperSource.WALLHAVEN,
+            category="general",
+            purity=WallpaperPurity.SFW,
+        )
+
+    wallpaper = make("https://w.wallhaven.cc/full/ab/wallhaven-ab.png")
+    assert wallpaper.filename == "wallhaven-ab.png"
+    assert wallpaper.extension == "png"
+    assert make("https://w.wallhaven.cc.example/full/noext").extension == "jpg"
+    assert "extension" not in make("http://example.com/full.jpg").to_dict()
+
+
+def test_wallpaper_uses_slots():
+    """Test Wallpaper instances don't carry a per-instance __dict__."""
+    wallpaper = Wallpaper(
+        id="test1",
+        url="http://example.com/view/1",
+        path="http://example.com/full.jpg",
+        resolution=Resolution(width=1920, height=1080),
+        source=WallpaperSource.WALLHAVEN,
+        category="general",
+        purity=WallpaperPurity.SFW,
+    )
+
+    assert not hasattr(wallpaper, "__dict__")
+    with pytest.raises(AttributeError):
+        wallpaper.unknown_attribute = 1
+
+
+def test_format_metadata():
+    """Test the shared resolution and size line."""
+    assert format_metadata(Resolution(1920, 1080), 3 * 1024 * 1024) == "1920x1080 • 3.0 MB"
+    assert format_metadata("800x600", 2048) == "800x600 • 2.0 KB"
+    assert format_metadata(None, 512) == "512 B"
+    assert format_metadata("", 0) == ""
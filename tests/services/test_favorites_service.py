@@ -61,6 +61,23 @@ def test_add_duplicate_favorite(
     assert len(favorites) == 1  # Should not duplicate
 
 
+def test_add_favorites_batch(
+    favorites_service: FavoritesService, sample_wallpaper: Wallpaper, mocker
+):
+    """Test adding several favorites writes the file once and skips duplicates."""
+    from dataclasses import replace
+
+    favorites_service.add_favorite(sample_wallpaper)
+    other = replace(sample_wallpaper, id="other")
+    save = mocker.spy(favorites_service, "_save_favorites")
+
+    added = favorites_service.add_favorites([sample_wallpaper, other, other])
+
+    assert added == 1
+    save.assert_called_once()
+    assert favorites_service.get_favorite_ids() == {sample_wallpaper.id, "other"}
+
+
 def test_remove_favorite(
     favorites_service: FavoritesService, sample_wallpaper: Wallpaper
 ):
@@ -87,6 +104,16 @@ def test_is_favorite(favorites_service: FavoritesService, sample_wallpaper: Wall
     assert favorites_service.is_favorite(sample_wallpaper.id)
 
 
+def test_get_favorite_ids(
+    favorites_service: FavoritesService, sample_wallpaper: Wallpaper
+):
+    """Test getting the set of favorite IDs."""
+    assert favorites_service.get_favorite_ids() == set()
+
+    favorites_service.add_favorite(sample_wallpaper)
+    assert favorites_service.get_favorite_ids() == {sample_wallpaper.id}
+
+
 def test_get_favorites(
     favorites_service: FavoritesService, sample_wallpaper: Wallpaper
 ):
@@ -316,3 +343,32 @@ def test_parse_favorites_data_invalid_item(favorites_service: FavoritesService,
     # Both items should be parsed successfully (thumbs_large provides valid path)
     assert len(favorites) == 2
     assert len(caplog.records) >= 0
+
+
+def test_get_favorites_reuses_parse_until_file_changes(
+    favorites_service: FavoritesService, sample_wallpaper: Wallpaper
+):
+    """Test unchanged favorites file is not parsed again."""
+    favorites_service.add_favorite(sample_wallpaper)
+    first = favorites_service.get_favorites()
+    assert favorites_service.get_favorites()[0] is first[0]
+
+    other = FavoritesService(favorites_file=favorites_service.favorites_file)
+    other.remove_favorite(sample_wallpaper.id)
+
+    assert favorites_service.get_favorites() == []
+
+
+def test_favorite_ids_follow_file_changes(
+    favorites_service: FavoritesService, sample_wallpaper: Wallpaper
+):
+    """Test duplicate checks see favorites removed by another instance."""
+    favorites_service.add_favorite(sample_wallpaper)
+    assert favorites_service.is_favorite(sample_wallpaper.id)
+
+    other = FavoritesService(favorites_file=favorites_service.favorites_file)
+    other.remove_favorite(sample_wallpaper.id)
+
+    assert not favorites_service.is_favorite(sample_wallpaper.id)
+    favorites_service.add_favorite(sample_wallpaper)
+    assert [f.wallpaper_id for f in other.get_favorites()] == [sample_wallpaper.id]
@@ -25,10 +25,43 @@ class TestLocalWallpaperModel:
         )
 
         assert wallpaper.path == path
+        assert wallpaper.path_str == "/test/image.jpg"
         assert wallpaper.filename == "image.jpg"
         assert wallpaper.size == 1024
         assert wallpaper.modified_time == 1234567890.0
 
+    def test_metadata_text(self):
+        """Test metadata_text formats resolution and size once"""
+        wallpaper = LocalWallpaper(
+            path=Path("/test/image.jpg"),
+            filename="image.jpg",
+            size=2 * 1024 * 1024,
+            modified_time=1234567890.0,
+            resolution="1920x1080",
+        )
+
+        assert wallpaper.metadata_text == "1920x1080 • 2.0 MB"
+
+        wallpaper.resolution = "3840x2160"
+        assert wallpaper.metadata_text == "3840x2160 • 2.0 MB"
+
+    def test_tags_display_refreshes_on_tag_change(self):
+        """Test tag display strings are rebuilt when tags are replaced"""
+        wallpaper = LocalWallpaper(
+            path=Path("/test/image.jpg"),
+            filename="image.jpg",
+            size=1024,
+            modified_time=1234567890.0,
+            tags=["a", "b", "c", "d", "e", "f"],
+        )
+
+        assert wallpaper.tags_display == "#a #b #c #d #e +1"
+        assert wallpaper.tags_tooltip == "a • b • c • d • e • f"
+
+        wallpaper.tags = ["nature"]
+        assert wallpaper.tags_display == "#nature"
+        assert wallpaper.tags_tooltip == "nature"
+
     def test_gobject_subclass(self):
         """Test LocalWallpaper is GObject subclass"""
         wallpaper = LocalWallpaper(
@@ -199,6 +232,34 @@ class TestGetWallpapers:
         assert wallpaper.size == 1024
         assert isinstance(wallpaper.modified_time, float)
 
+    def test_get_wallpapers_skips_unreadable_subdirectory(self, tmp_path):
+        """Test that one unreadable subdirectory doesn't abort the scan"""
+        import os
+
+        (tmp_path / "image1.jpg").touch()
+        os.utime(tmp_path / "image1.jpg", (1000, 1000))
+        locked = tmp_path / "locked"
+        locked.mkdir()
+        (locked / "hidden.jpg").touch()
+        other = tmp_path / "other"
+        other.mkdir()
+        (other / "image2.png").touch()
+        os.utime(other / "image2.png", (2000, 2000))
+
+        real_scandir = os.scandir
+
+        def scandir(path):
+            if Path(path) == locked:
+                raise PermissionError(13, "Permission denied", str(path))
+            return real_scandir(path)
+
+        service = LocalWallpaperService(pictures_dir=tmp_path)
+        with patch("services.local_service.os.scandir", side_effect=scandir):
+            wallpapers = service.get_wallpapers(recursive=True)
+
+        # The scan finishes and is sorted newest first
+        assert [w.filename for w in wallpapers] == ["image2.png", "image1.jpg"]
+
 
 class TestDeleteWallpaper:
     """Test delete_wallpaper method"""
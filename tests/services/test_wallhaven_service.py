@@ -63,21 +63,49 @@ class TestGetSession:
         """Test creating session with API key."""
         service = WallhavenService(api_key="test_key")
 
-        with patch("aiohttp.ClientSession") as mock_session_cls:
+        with (
+            patch("aiohttp.ClientSession") as mock_session_cls,
+            patch("aiohttp.TCPConnector") as mock_connector_cls,
+        ):
             await service._get_session()
 
-            mock_session_cls.assert_called_once_with(headers={"X-API-Key": "test_key"})
+            mock_session_cls.assert_called_once_with(
+                headers={"X-API-Key": "test_key"},
+                connector=mock_connector_cls.return_value,
+            )
 
     @pytest.mark.asyncio
     async def test_create_session_without_api_key(self):
         """Test creating session without API key."""
         service = WallhavenService()
 
-        with patch("aiohttp.ClientSession") as mock_session_cls:
+        with (
+            patch("aiohttp.ClientSession") as mock_session_cls,
+            patch("aiohttp.TCPConnector") as mock_connector_cls,
+        ):
             await service._get_session()
 
             # Even without API key, headers={} is passed
-            mock_session_cls.assert_called_once_with(headers={})
+            mock_session_cls.assert_called_once_with(
+                headers={}, connector=mock_connector_cls.return_value
+            )
+
+    @pytest.mark.asyncio
+    async def test_session_uses_bounded_connector(self):
+        """Test that the session's connection pool is capped."""
+        service = WallhavenService()
+
+        with (
+            patch("aiohttp.ClientSession"),
+            patch("aiohttp.TCPConnector") as mock_connector_cls,
+        ):
+            await service._get_session()
+
+            mock_connector_cls.assert_called_once_with(
+                limit=WallhavenService.MAX_CONNECTIONS,
+                limit_per_host=WallhavenService.MAX_CONNECTIONS_PER_HOST,
+                ttl_dns_cache=WallhavenService.DNS_CACHE_TTL,
+            )
 
     @pytest.mark.asyncio
     async def test_reuse_existing_session(self):
@@ -95,11 +123,16 @@ class TestGetSession:
         service = WallhavenService()
         service._session = None
 
-        with patch("aiohttp.ClientSession") as mock_session_cls:
+        with (
+            patch("aiohttp.ClientSession") as mock_session_cls,
+            patch("aiohttp.TCPConnector") as mock_connector_cls,
+        ):
             await service._get_session()
 
             # Even without API key, headers={} is passed
-            mock_session_cls.assert_called_once_with(headers={})
+            mock_session_cls.assert_called_once_with(
+                headers={}, connector=mock_connector_cls.return_value
+            )
 
 
 class TestRateLimit:
@@ -135,6 +168,26 @@ class TestRateLimit:
             sleep_args = mock_sleep.call_args[0]
             assert sleep_args[0] > 0
 
+    @pytest.mark.asyncio
+    async def test_rate_limit_spaces_concurrent_callers(self):
+        """Test concurrent callers are released one interval apart."""
+        import asyncio
+
+        service = WallhavenService()
+        service.REQUEST_INTERVAL = 0.05
+        loop = asyncio.get_event_loop()
+        released = []
+
+        async def call():
+            await service._rate_limit()
+            released.append(loop.time())
+
+        await asyncio.gather(*(call() for _ in range(4)))
+
+        gaps = [b - a for a, b in zip(released, released[1:], strict=False)]
+        assert len(gaps) == 3
+        assert all(gap >= service.REQUEST_INTERVAL * 0.9 for gap in gaps)
+
 
 class TestSearch:
     """Tests for search method."""
@@ -496,6 +549,42 @@ class TestDownload:
                 )
 
     @pytest.mark.asyncio
+    async def test_download_removes_partial_file(self, wallhaven_service, tmp_path):
+        """Test that an interrupted download doesn't leave a partial file."""
+        wallpaper = Wallpaper(
+            id="abc123",
+            url="https://wallhaven.cc/w/abc123",
+            path="https://w.wallhaven.cc/full/abc123.jpg",
+            resolution=Resolution(1920, 1080),
+            source=WallpaperSource.WALLHAVEN,
+            category="general",
+            purity=WallpaperPurity.SFW,
+        )
+
+        dest = tmp_path / "wallpapers" / "abc123.jpg"
+
+        with patch.object(wallhaven_service, "_get_session") as mock_get_session:
+            with patch.object(wallhaven_service, "_rate_limit"):
+                mock_session = AsyncMock()
+                mock_response = MagicMock()
+                mock_response.headers = {"content-length": "1000"}
+                mock_response.raise_for_status = MagicMock()
+
+                async def iter_chunked(n):
+                    yield b"partial"
+                    raise aiohttp.ClientPayloadError("connection reset")
+
+                mock_response.content.iter_chunked = iter_chunked
+
+                mock_context = MockAsyncContextManager(mock_response)
+                mock_session.get = MagicMock(return_value=mock_context)
+                mock_get_session.return_value = mock_session
+
+                result = await wallhaven_service.download(wallpaper, dest)
+
+                assert result is False
+                assert not dest.exists()
+    @pytest.mark.asyncio
     async def test_download_http_error(self, wallhaven_service, tmp_path):
         """Test download with HTTP error."""
         wallpaper = Wallpaper(
@@ -0,0 +1,47 @@
+"""Tests for FavoritesView handlers."""
+
+from unittest.mock import MagicMock
+
+from ui.views.favorites_view import FavoritesView
+
+
+def test_favorites_changed_updates_status():
+    """Test a favorites change refreshes the grid and the status label."""
+    view = MagicMock()
+    view.view_model.favorites = [MagicMock(), MagicMock()]
+    view.update_status = lambda: FavoritesView.update_status(view)
+
+    FavoritesView._on_favorites_changed(view)
+
+    view.update_wallpapers_grid.assert_called_once()
+    view.status_label.set_text.assert_called_once_with("2 favorites")
+
+
+def test_deselecting_last_card_refreshes_every_card():
+    """Test leaving selection mode clears the mode class from all cards."""
+    view = MagicMock()
+    view.view_model.selection_mode = True
+
+    def deselect_last(wallpaper):
+        view.view_model.selection_mode = False
+
+    view.view_model.toggle_selection.side_effect = deselect_last
+    card = MagicMock()
+
+    FavoritesView._on_card_clicked(view, 1, card)
+
+    view.view_model.toggle_selection.assert_called_once_with(card.favorite.wallpaper)
+    view._refresh_selection_classes.assert_called_once()
+    view._apply_selection_classes.assert_not_called()
+
+
+def test_toggling_within_selection_mode_updates_only_that_card():
+    """Test a toggle that keeps selection mode restyles just the clicked card."""
+    view = MagicMock()
+    view.view_model.selection_mode = True
+    card = MagicMock()
+
+    FavoritesView._on_card_clicked(view, 1, card)
+
+    view._apply_selection_classes.assert_called_once_with(card)
+    view._refresh_selection_classes.assert_not_called()
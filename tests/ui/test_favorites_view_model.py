@@ -209,3 +209,23 @@ class TestFavoritesViewModelRefresh:
         await favorites_view_model.refresh_favorites()
 
         assert favorites_view_model.search_query == ""
+
+    def test_new_query_cancels_pending_search(self, favorites_view_model, mocker):
+        """Test that typing a new query cancels the previous search."""
+        first, second = mocker.Mock(), mocker.Mock()
+        pending = [first, second]
+
+        def fake_schedule(coro):
+            coro.close()
+            return pending.pop(0)
+
+        mocker.patch(
+            "ui.view_models.favorites_view_model.schedule_async",
+            side_effect=fake_schedule,
+        )
+
+        favorites_view_model.search_query = "te"
+        favorites_view_model.search_query = "test"
+
+        first.cancel.assert_called_once()
+        second.cancel.assert_not_called()
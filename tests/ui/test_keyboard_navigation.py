@@ -91,8 +91,8 @@ def test_cards_are_made_focusable():
 
     # Verify cards are made focusable
     assert "set_can_focus(True)" in content or "set_focusable(True)" in content
-    # Verify card->wallpaper mapping exists
-    assert "card_wallpaper_map" in content
+    # Verify recycled cards carry the wallpaper they are bound to
+    assert "card.wallpaper = wallpaper" in content
 
 
 def test_css_focus_styles_exist():
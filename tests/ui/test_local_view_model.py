@@ -123,6 +123,25 @@ class TestLocalViewModelDeleteWallpaper:
 
         assert len(local_view_model.wallpapers) == initial_count - 1
 
+    @pytest.mark.asyncio
+    async def test_delete_stale_instance_removes_listed_wallpaper(self, local_view_model):
+        """Test deleting via an older object for the same path still updates the list."""
+        await local_view_model.load_wallpapers()
+        listed = local_view_model.wallpapers[0]
+        stale = LocalWallpaper(
+            path=listed.path,
+            filename=listed.filename,
+            size=listed.size,
+            modified_time=listed.modified_time,
+            tags=[],
+        )
+
+        success, _ = await local_view_model.delete_wallpaper(stale)
+
+        assert success is True
+        assert listed not in local_view_model.wallpapers
+        assert len(local_view_model.wallpapers) == 2
+
 
 class TestLocalViewModelRefresh:
     """Test refresh_wallpapers method."""
@@ -344,3 +363,148 @@ class TestLocalViewModelFiltering:
         result = local_view_model._apply_aspect_filter([wp1, wp2], {})
 
         assert len(result) == 2
+
+
+class TestLocalViewModelQueueSignals:
+    """Test upscaling queue change notifications."""
+
+    def test_emit_queue_changed_skips_unchanged_stats(self, local_view_model, mocker):
+        """Test that identical queue stats do not re-emit the signal."""
+        emit = mocker.spy(local_view_model, "emit")
+
+        local_view_model._active_count = 1
+        local_view_model._emit_queue_changed()
+        local_view_model._emit_queue_changed()
+
+        emit.assert_called_once_with("upscaling-queue-changed", 0, 1)
+
+    def test_emit_queue_changed_notifies_only_changed(self, local_view_model, mocker):
+        """Test that only properties with new values are notified."""
+        notify = mocker.spy(local_view_model, "notify")
+
+        local_view_model._active_count = 1
+        local_view_model._emit_queue_changed()
+
+        notified = [c.args[0] for c in notify.call_args_list]
+        assert "upscaling-active-count" in notified
+        assert "upscaling-total-count" in notified
+        assert "upscaling-queue-size" not in notified
+
+    def test_queue_upscale_rejects_when_full(self, local_view_model, tmp_path, mocker):
+        """Test that a full upscaling queue refuses new items."""
+        mocker.patch.object(local_view_model, "_process_upscale_queue")
+        wallpaper = LocalWallpaper(
+            path=tmp_path / "a.jpg", filename="a.jpg", size=100, modified_time=1.0
+        )
+        local_view_model.MAX_UPSCALE_QUEUE_SIZE = 1
+
+        queued, _ = local_view_model.queue_upscale(wallpaper)
+        rejected, message = local_view_model.queue_upscale(wallpaper)
+
+        assert queued is True
+        assert rejected is False
+        assert "full" in message
+        assert len(local_view_model._upscale_queue) == 1
+
+    @pytest.mark.asyncio
+    async def test_run_upscale_updates_model_metadata(self, local_view_model, tmp_path, mocker):
+        """Test that a finished upscale stores the new size and resolution."""
+        from PIL import Image
+
+        source = tmp_path / "a.png"
+        Image.new("RGB", (100, 100)).save(source)
+        wallpaper = LocalWallpaper(
+            path=source,
+            filename="a.png",
+            size=source.stat().st_size,
+            modified_time=1.0,
+            resolution="100x100",
+        )
+
+        async def fake_exec(*args, **kwargs):
+            Image.new("RGB", (200, 200)).save(args[args.index("-o") + 1])
+            process = mocker.MagicMock(returncode=0)
+            process.communicate = mocker.AsyncMock(return_value=(b"", b""))
+            return process
+
+        mocker.patch("ui.view_models.local_view_model.shutil.which", return_value="/bin/true")
+        mocker.patch("asyncio.create_subprocess_exec", side_effect=fake_exec)
+        mocker.patch.object(local_view_model, "_finish_upscale")
+
+        success, _ = await local_view_model._run_upscale_async(wallpaper)
+
+        assert success is True
+        assert wallpaper.resolution == "200x200"
+        assert wallpaper.size == source.stat().st_size
+        assert wallpaper.metadata_text.startswith("200x200")
+
+
+class TestLocalViewModelImageSize:
+    """Test image size lookup used when adding favorites."""
+
+    def test_get_image_size_uses_known_resolution(self, local_view_model, tmp_path, mocker):
+        """Test that a cached resolution avoids opening the image."""
+        load = mocker.patch.object(LocalWallpaper, "_load_resolution")
+        wallpaper = LocalWallpaper(
+            path=tmp_path / "a.jpg",
+            filename="a.jpg",
+            size=100,
+            modified_time=1.0,
+            resolution="2560x1440",
+        )
+
+        assert local_view_model._get_image_size(wallpaper) == (2560, 1440)
+        load.assert_not_called()
+
+    def test_get_image_size_falls_back_to_default(self, local_view_model, tmp_path):
+        """Test that unreadable images fall back to 1920x1080."""
+        wallpaper = LocalWallpaper(
+            path=tmp_path / "missing.jpg",
+            filename="missing.jpg",
+            size=100,
+            modified_time=1.0,
+        )
+
+        assert local_view_model._get_image_size(wallpaper) == (1920, 1080)
+
+
+class TestLocalViewModelAddToFavorites:
+    """Test add_to_favorites method."""
+
+    @pytest.mark.asyncio
+    async def test_add_to_favorites_success(
+        self, local_view_model, mock_favorites_service, tmp_path
+    ):
+        """Test adding a new local wallpaper to favorites."""
+        local_view_model.favorites_service = mock_favorites_service
+        wallpaper = LocalWallpaper(
+            path=tmp_path / "a.jpg",
+            filename="a.jpg",
+            size=100,
+            modified_time=1.0,
+            resolution="1920x1080",
+        )
+
+        success, message = await local_view_model.add_to_favorites(wallpaper)
+
+        assert success is True
+        assert "a.jpg" in message
+        mock_favorites_service.add_favorite.assert_called_once()
+        assert local_view_model.is_busy is False
+
+    @pytest.mark.asyncio
+    async def test_add_to_favorites_already_favorite(
+        self, local_view_model, mock_favorites_service, tmp_path
+    ):
+        """Test that existing favorites are not added twice."""
+        mock_favorites_service.is_favorite.return_value = True
+        local_view_model.favorites_service = mock_favorites_service
+        wallpaper = LocalWallpaper(
+            path=tmp_path / "a.jpg", filename="a.jpg", size=100, modified_time=1.0
+        )
+
+        success, message = await local_view_model.add_to_favorites(wallpaper)
+
+        assert success is False
+        assert message == "Already in favorites"
+        mock_favorites_service.add_favorite.assert_not_called()
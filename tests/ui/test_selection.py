@@ -141,6 +141,22 @@ class TestSelection:
 
         assert local_view_model.selection_mode is True
 
+    @pytest.mark.asyncio
+    async def test_is_selected_after_select_all(
+        self, local_view_model, mock_local_service
+    ):
+        """Test is_selected reflects select all and a later toggle."""
+        local_view_model._wallpapers = await mock_local_service.get_wallpapers_async()
+        local_view_model.select_all()
+        first = local_view_model.wallpapers[0]
+
+        assert all(local_view_model.is_selected(w) for w in local_view_model.wallpapers)
+
+        local_view_model.toggle_selection(first)
+
+        assert local_view_model.is_selected(first) is False
+        assert local_view_model.selected_count == len(local_view_model.wallpapers) - 1
+
 
 class TestWallhavenViewModelSelection:
     """Test selection functionality in WallhavenViewModel."""
@@ -1,5 +1,8 @@
 """Tests for WallhavenViewModel."""
 
+import asyncio
+from unittest.mock import AsyncMock
+
 import pytest
 
 
@@ -69,6 +72,62 @@ class TestWallhavenViewModelSearchWallpapers:
         assert "Failed to search wallpapers" in wallhaven_view_model.error_message
         assert wallhaven_view_model.wallpapers == []
 
+    @pytest.mark.asyncio
+    async def test_new_search_cancels_in_flight_search(
+        self, wallhaven_view_model, mock_wallhaven_service
+    ):
+        """Test that a newer search supersedes one still waiting on the API."""
+        release = asyncio.Event()
+        original_search = mock_wallhaven_service.search.side_effect
+
+        async def slow_search(*args, **kwargs):
+            if kwargs.get("query") == "old":
+                await release.wait()
+            return await original_search(*args, **kwargs)
+
+        mock_wallhaven_service.search.side_effect = slow_search
+
+        old_search = asyncio.create_task(
+            wallhaven_view_model.search_wallpapers(query="old")
+        )
+        await asyncio.sleep(0)
+        await wallhaven_view_model.search_wallpapers(query="new")
+
+        # Only the stale fetch is cancelled; its caller returns normally
+        assert old_search.done() and not old_search.cancelled()
+        assert wallhaven_view_model.search_query == "new"
+        assert len(wallhaven_view_model.wallpapers) == 3
+
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_searches_share_request(
+        self, wallhaven_view_model, mock_wallhaven_service
+    ):
+        """Test that a duplicate search joins the in-flight one."""
+        release = asyncio.Event()
+        original_search = mock_wallhaven_service.search.side_effect
+
+        async def slow_search(*args, **kwargs):
+            await release.wait()
+            return await original_search(*args, **kwargs)
+
+        mock_wallhaven_service.search.side_effect = slow_search
+
+        first = asyncio.create_task(
+            wallhaven_view_model.search_wallpapers(query="same", sorting="random")
+        )
+        await asyncio.sleep(0)
+        second = asyncio.create_task(
+            wallhaven_view_model.search_wallpapers(query="same", sorting="random")
+        )
+        await asyncio.sleep(0)
+        assert not second.done()
+
+        release.set()
+        await asyncio.gather(first, second)
+
+        mock_wallhaven_service.search.assert_called_once()
+        assert len(wallhaven_view_model.wallpapers) == 3
+
 
 class TestWallhavenViewModelPagination:
     """Test pagination methods."""
@@ -161,3 +220,218 @@ class TestWallhavenViewModelProperties:
         """Test resolution property get/set."""
         wallhaven_view_model.resolution = "1920x1080"
         assert wallhaven_view_model.resolution == "1920x1080"
+
+
+    @pytest.mark.asyncio
+    async def test_search_notifies_only_changed_filters(
+        self, wallhaven_view_model, mock_wallhaven_service, mocker
+    ):
+        """Test that a search only notifies filter properties whose value changed."""
+        on_category = mocker.Mock()
+        on_purity = mocker.Mock()
+        wallhaven_view_model.connect("notify::category", on_category)
+        wallhaven_view_model.connect("notify::purity", on_purity)
+
+        await wallhaven_view_model.search_wallpapers(query="test", category="010")
+
+        on_category.assert_called_once()
+        on_purity.assert_not_called()
+
+class TestWallhavenViewModelPrefetch:
+    """Test background prefetching of result pages."""
+
+    @pytest.mark.asyncio
+    async def test_next_page_served_from_prefetch(
+        self, wallhaven_view_model, mock_wallhaven_service
+    ):
+        """Test that the next page is prefetched and reused on navigation."""
+        await wallhaven_view_model.search_wallpapers(query="test")
+        await asyncio.gather(*wallhaven_view_model._prefetch_tasks.values())
+
+        assert mock_wallhaven_service.search.call_count == 2
+        assert mock_wallhaven_service.search.call_args.kwargs["page"] == 2
+
+        await wallhaven_view_model.load_next_page()
+        await asyncio.gather(*wallhaven_view_model._prefetch_tasks.values())
+
+        assert wallhaven_view_model.current_page == 2
+        # Page 2 came from the cache; only the page 3 prefetch hit the service
+        assert mock_wallhaven_service.search.call_count == 3
+        assert mock_wallhaven_service.search.call_args.kwargs["page"] == 3
+
+    @pytest.mark.asyncio
+    async def test_no_prefetch_for_unseeded_random(
+        self, wallhaven_view_model, mock_wallhaven_service
+    ):
+        """Test that unseeded random searches are not prefetched."""
+        await wallhaven_view_model.search_wallpapers(query="test", sorting="random")
+
+        assert wallhaven_view_model._prefetch_tasks == {}
+
+    @pytest.mark.asyncio
+    async def test_filter_change_cancels_prefetch(
+        self, wallhaven_view_model, mock_wallhaven_service
+    ):
+        """Test that changing a filter aborts prefetches for the old filters."""
+        original_search = mock_wallhaven_service.search.side_effect
+
+        async def slow_next_page(*args, **kwargs):
+            if kwargs.get("page") == 2:
+                await asyncio.Event().wait()
+            return await original_search(*args, **kwargs)
+
+        mock_wallhaven_service.search.side_effect = slow_next_page
+
+        await wallhaven_view_model.search_wallpapers(query="test")
+        pending = list(wallhaven_view_model._prefetch_tasks.values())
+        assert pending
+
+        # The cancel is handed to the loop rather than run in the setter
+        wallhaven_view_model.category = "010"
+        assert wallhaven_view_model._prefetch_tasks
+
+        await asyncio.sleep(0)
+        assert wallhaven_view_model._prefetch_tasks == {}
+        await asyncio.wait(pending)
+        assert all(task.cancelled() for task in pending)
+
+    @pytest.mark.asyncio
+    async def test_repeated_search_served_from_cache(
+        self, wallhaven_view_model, mock_wallhaven_service
+    ):
+        """Test that repeating a search reuses the cached page."""
+        await wallhaven_view_model.search_wallpapers(query="test")
+        await asyncio.gather(*wallhaven_view_model._prefetch_tasks.values())
+
+        await wallhaven_view_model.search_wallpapers(query="test")
+
+        # First page plus the page 2 prefetch; the repeat never hit the service
+        assert mock_wallhaven_service.search.call_count == 2
+        assert len(wallhaven_view_model.wallpapers) == 3
+
+    @pytest.mark.asyncio
+    async def test_expired_cache_entry_refetched(
+        self, wallhaven_view_model, mock_wallhaven_service
+    ):
+        """Test that stale cache entries are not reused."""
+        from ui.view_models.wallhaven_view_model import SEARCH_CACHE_TTL
+
+        await wallhaven_view_model.search_wallpapers(query="test")
+        await asyncio.gather(*wallhaven_view_model._prefetch_tasks.values())
+
+        cache = wallhaven_view_model._search_cache
+        for key, (wallpapers, meta, fetched_at) in cache.items():
+            cache[key] = (wallpapers, meta, fetched_at - SEARCH_CACHE_TTL)
+
+        await wallhaven_view_model.search_wallpapers(query="test")
+
+        assert mock_wallhaven_service.search.call_count == 3
+
+
+class TestWallhavenViewModelDownloadMany:
+    """Test download_many method."""
+
+    @pytest.mark.asyncio
+    async def test_download_many_returns_paths_in_order(
+        self, wallhaven_view_model, mock_wallhaven_service, mock_config_service, tmp_path
+    ):
+        """Test that every wallpaper is downloaded and results keep input order."""
+        mock_config_service.get_config.return_value.local_wallpapers_dir = tmp_path
+        mock_wallhaven_service.download = AsyncMock(return_value=True)
+        wallpapers, _ = await mock_wallhaven_service.search()
+
+        paths = await wallhaven_view_model.download_many(wallpapers)
+
+        assert mock_wallhaven_service.download.call_count == 3
+        assert paths == [str(tmp_path / f"wh_{i}.jpg") for i in range(3)]
+
+    @pytest.mark.asyncio
+    async def test_download_many_isolates_failures(
+        self, wallhaven_view_model, mock_wallhaven_service, mock_config_service, tmp_path, mocker
+    ):
+        """Test that one failing download does not abort the batch."""
+        mock_config_service.get_config.return_value.local_wallpapers_dir = tmp_path
+
+        async def download(wallpaper, dest_path):
+            if wallpaper.id == "wh_1":
+                raise RuntimeError("boom")
+            return True
+
+        mock_wallhaven_service.download = AsyncMock(side_effect=download)
+        wallpapers, _ = await mock_wallhaven_service.search()
+        on_busy = mocker.Mock()
+        wallhaven_view_model.connect("notify::is-busy", on_busy)
+
+        paths = await wallhaven_view_model.download_many(wallpapers)
+
+        assert paths[1] is None
+        assert paths[0] and paths[2]
+        # Busy is raised and cleared once for the whole batch
+        assert on_busy.call_count == 2
+        assert wallhaven_view_model.is_busy is False
+
+    @pytest.mark.asyncio
+    async def test_download_skips_existing_file(
+        self, wallhaven_view_model, mock_wallhaven_service, mock_config_service, tmp_path
+    ):
+        """Test that an existing non-empty file is reused without a request."""
+        mock_config_service.get_config.return_value.local_wallpapers_dir = tmp_path
+        mock_wallhaven_service.download = AsyncMock(return_value=True)
+        wallpapers, _ = await mock_wallhaven_service.search()
+        (tmp_path / "wh_0.jpg").write_bytes(b"image")
+        (tmp_path / "wh_1.jpg").touch()
+
+        await wallhaven_view_model.download_many(wallpapers[:2])
+
+        # Only the empty leftover is downloaded again
+        mock_wallhaven_service.download.assert_called_once()
+        assert mock_wallhaven_service.download.call_args.args[0].id == "wh_1"
+
+
+class TestWallhavenViewModelAppendResults:
+    """Test appending result pages to the current results."""
+
+    @pytest.mark.asyncio
+    async def test_append_extends_in_place(
+        self, wallhaven_view_model, mock_wallhaven_service, mocker
+    ):
+        """Test that appended pages emit items-added instead of replacing the list."""
+        await wallhaven_view_model.search_wallpapers(query="test")
+        first_page = wallhaven_view_model.wallpapers
+        on_added = mocker.Mock()
+        on_replaced = mocker.Mock()
+        wallhaven_view_model.connect("items-added", on_added)
+        wallhaven_view_model.connect("notify::wallpapers", on_replaced)
+
+        await wallhaven_view_model.search_wallpapers(
+            query="test", page=2, append_results=True
+        )
+
+        assert wallhaven_view_model.wallpapers is first_page
+        assert len(first_page) == 6
+        assert len(wallhaven_view_model.thumbnail_urls) == 6
+        on_added.assert_called_once()
+        assert on_added.call_args.args[1] == 3
+        on_replaced.assert_not_called()
+
+
+class TestWallhavenViewModelAddToFavorites:
+    """Test add_to_favorites_async method."""
+
+    @pytest.mark.asyncio
+    async def test_duplicate_does_not_toggle_busy(
+        self, wallhaven_view_model, mock_wallhaven_service, mock_favorites_service, mocker
+    ):
+        """Test that adding an existing favorite leaves busy state untouched."""
+        wallhaven_view_model.favorites_service = mock_favorites_service
+        mock_favorites_service.is_favorite.return_value = True
+        wallpapers, _ = await mock_wallhaven_service.search()
+        on_busy = mocker.Mock()
+        wallhaven_view_model.connect("notify::is-busy", on_busy)
+
+        success, message = await wallhaven_view_model.add_to_favorites_async(wallpapers[0])
+
+        assert success is False
+        assert message == "Already in favorites"
+        on_busy.assert_not_called()
+        mock_favorites_service.add_favorite.assert_not_called()